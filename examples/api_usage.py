@@ -5,8 +5,20 @@ Demonstrates the preferred, official method for video information extraction
 """
 
 import os
+import sys
+from functools import lru_cache
+
 from yt_info_extract import YouTubeVideoInfoExtractor
 
+# Cache results on disk between runs; pass --no-cache to always hit YouTube (e.g. benchmarking)
+CACHE_PATH = None if "--no-cache" in sys.argv else "~/.cache/yt_info_extract/examples.sqlite"
+
+
+@lru_cache(maxsize=4)
+def _extractor(strategy, api_key=None):
+    """Build each extractor (and its API client) once and share it between examples"""
+    return YouTubeVideoInfoExtractor(api_key=api_key, strategy=strategy, cache_path=CACHE_PATH)
+
 
 def example_api_setup():
     """Example showing how to set up and use the YouTube Data API v3"""
@@ -22,10 +34,10 @@ def example_api_setup():
     env_api_key = os.environ.get("YOUTUBE_API_KEY")
     if env_api_key:
         print("✓ API key found in environment variables")
-        extractor = YouTubeVideoInfoExtractor(strategy="api")
+        extractor = _extractor("api")
     elif api_key != "your_api_key_here":
         print("✓ Using API key from code (not recommended for production)")
-        extractor = YouTubeVideoInfoExtractor(api_key=api_key, strategy="api")
+        extractor = _extractor("api", api_key)
     else:
         print("⚠ No API key provided. Set YOUTUBE_API_KEY environment variable")
         print("or replace 'your_api_key_here' with your actual API key")
@@ -61,7 +73,7 @@ def example_api_batch_processing():
     # Note: The API allows up to 50 video IDs in a single request
     # This is much more quota-efficient than individual requests
     
-    extractor = YouTubeVideoInfoExtractor(strategy="api")
+    extractor = _extractor("api")
     
     if not extractor.test_api_key():
         print("⚠ API key not available, skipping API batch example")
@@ -77,25 +89,29 @@ def example_api_batch_processing():
     
     print(f"Processing {len(video_ids)} videos with API...")
     
-    # The extractor will automatically batch API requests for efficiency
-    results = extractor.batch_extract(video_ids, strategy="api", delay_between_requests=0.1)
+    # All IDs go out in a single videos.list call (up to 50 IDs per request)
+    results = extractor.batch_extract(video_ids, strategy="api")
     
     print(f"\nResults:")
+    successful = 0
     for i, result in enumerate(results):
         if result.get('error'):
             print(f"{i+1}. ERROR: {result.get('error')}")
         else:
+            successful += 1
             title = result['title'][:40] + "..." if len(result['title']) > 40 else result['title']
             views = result.get('views', 0)
             method = result.get('extraction_method', 'unknown')
             print(f"{i+1}. {title} | {views:,} views | {method}")
+    
+    print(f"Successful: {successful}/{len(results)}")
 
 
 def example_api_quota_management():
     """Example showing quota-conscious usage"""
     print("\n=== API Quota Management Example ===")
     
-    extractor = YouTubeVideoInfoExtractor(strategy="api")
+    extractor = _extractor("api")
     
     if not extractor.test_api_key():
         print("⚠ API key not available, skipping quota management example")
@@ -136,7 +152,7 @@ def example_api_error_handling():
         ("abcdefghijk", "Valid format but non-existent video"),
     ]
     
-    extractor = YouTubeVideoInfoExtractor(strategy="api")
+    extractor = _extractor("api")
     
     if not extractor.test_api_key():
         print("⚠ API key not available, skipping API error handling example")
@@ -167,7 +183,7 @@ def example_api_vs_alternatives():
         print(f"\nTrying {strategy}...")
         
         try:
-            extractor = YouTubeVideoInfoExtractor(strategy=strategy)
+            extractor = _extractor(strategy)
             
             if strategy == "api" and not extractor.test_api_key():
                 print(f"  ⚠ {strategy}: API key not available")
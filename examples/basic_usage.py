@@ -1,4 +1,99 @@
-: {info['title']}")
+#!/usr/bin/env python3
+"""
+Basic usage examples for yt_info_extract
+Demonstrates single-video extraction, fallback strategies, batch processing and export
+"""
+
+import asyncio
+import string
+import sys
+
+from yt_info_extract import (
+    YouTubeVideoInfoExtractor,
+    export_video_info,
+    get_video_info,
+    get_video_stats,
+)
+
+# Cache results on disk between runs; pass --no-cache to always hit YouTube (e.g. benchmarking)
+CACHE_PATH = None if "--no-cache" in sys.argv else "~/.cache/yt_info_extract/examples.sqlite"
+
+# Characters allowed in a YouTube video ID
+VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+
+def batch_extract_async(video_ids, strategy="auto", concurrency=4):
+    """Extract several videos concurrently, returning results in input order
+
+    concurrency is an upper bound: yt-dlp/pytubefix requests also share an adaptive
+    limiter that starts at 2 in flight, grows while YouTube keeps answering and halves
+    whenever it throttles (HTTP 429/403).
+    """
+
+    async def _fetch_all():
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _fetch_one(video_id):
+            # Calls share one extractor, which gives each worker thread its own connections
+            async with semaphore:
+                info = await loop.run_in_executor(None, get_video_info, video_id, None, strategy)
+            return info or {"video_id": video_id, "error": "Extraction failed", "extraction_method": None}
+
+        return await asyncio.gather(*[_fetch_one(video_id) for video_id in video_ids])
+
+    return asyncio.run(_fetch_all())
+
+
+def example_basic_usage():
+    """Basic example of extracting video information"""
+    print("=== Basic Usage Example ===")
+    
+    video_id = "jNQXAC9IVRw"  # Me at the zoo
+    
+    # Simplest form: convenience function with automatic strategy selection
+    info = get_video_info(video_id)
+    
+    if info:
+        print(f"Title: {info['title']}")
+        print(f"Channel: {info['channel_name']}")
+        print(f"Views: {info['views']:,}" if info['views'] else "Views: Unknown")
+        print(f"Published: {info['publication_date']}")
+        print(f"Method: {info['extraction_method']}")
+    else:
+        print("✗ Failed to extract video information")
+
+
+def example_with_api_key():
+    """Example using the YouTube Data API v3 with an explicit key"""
+    print("\n=== API Key Example ===")
+    
+    api_key = "your_api_key_here"  # Replace with your actual API key
+    
+    extractor = YouTubeVideoInfoExtractor(api_key=api_key, strategy="api")
+    info = extractor.get_video_info("jNQXAC9IVRw")
+    
+    if info:
+        print(f"✓ Title: {info['title']}")
+    else:
+        print("✗ Failed to extract video information (check your API key)")
+
+
+def example_fallback_strategies():
+    """Example trying each extraction strategy explicitly"""
+    print("\n=== Fallback Strategies Example ===")
+    
+    video_id = "jNQXAC9IVRw"
+    
+    for strategy in ["yt_dlp", "pytubefix"]:
+        print(f"\nTrying {strategy}...")
+        
+        try:
+            extractor = YouTubeVideoInfoExtractor(strategy=strategy)
+            info = extractor.get_video_info(video_id)
+            
+            if info:
+                print(f"✓ Success with {strategy}: {info['title']}")
             else:
                 print(f"✗ Failed with {strategy}")
                 
@@ -19,26 +114,24 @@ def example_batch_processing():
     
     print(f"Processing {len(video_ids)} videos...")
     
-    # Using convenience function
-    from yt_info_extract import get_video_info_batch
-    
-    results = get_video_info_batch(
-        video_ids, 
-        delay_between_requests=1.0  # Be nice to YouTube's servers
-    )
+    # Requests run concurrently, so wall time tracks the slowest video rather than the sum.
+    # Keep concurrency low to be nice to YouTube's servers.
+    results = batch_extract_async(video_ids, concurrency=3)
     
     print(f"\nResults summary:")
-    successful = len([r for r in results if not r.get('error')])
-    print(f"Successful: {successful}/{len(results)}")
-    
+    # Count successes while printing so results are only walked once
+    successful = 0
     for i, result in enumerate(results):
         if result.get('error'):
             print(f"{i+1}. ERROR: {result.get('error')}")
         else:
+            successful += 1
             title = result['title'][:50] + "..." if len(result['title']) > 50 else result['title']
             views = result.get('views', 0)
             method = result.get('extraction_method', 'unknown')
             print(f"{i+1}. {title} | {views:,} views | {method}")
+    
+    print(f"Successful: {successful}/{len(results)}")
 
 
 def example_formatted_stats():
@@ -81,10 +174,15 @@ def example_export_data():
         if csv_success:
             print("✓ Exported to video_info.csv")
         
-        # You can also export batch results
-        batch_results = get_video_info_batch([video_id, "dQw4w9WgXcQ"])
-        export_video_info(batch_results, "batch_results.json")
-        export_video_info(batch_results, "batch_results.csv", format_type="csv")
+        # You can also export batch results. Generators are streamed to disk row by row,
+        # so large batches never need to be held in memory all at once; the second pass
+        # is served from the on-disk cache.
+        def iter_batch():
+            for vid in [video_id, "dQw4w9WgXcQ"]:
+                yield get_video_info(vid, cache_path=CACHE_PATH) or {"video_id": vid}
+        
+        export_video_info(iter_batch(), "batch_results.json")
+        export_video_info(iter_batch(), "batch_results.csv", format_type="csv")
         print("✓ Exported batch results")
 
 
@@ -114,10 +212,10 @@ def example_error_handling():
 
 
 def example_url_formats():
-    """Example showing different URL format support"""
-    print("\n=== URL Format Support Example ===")
+    """Example showing which input formats are accepted"""
+    print("\n=== Input Format Example ===")
     
-    # Different URL formats for the same video
+    # Different inputs for the same video; only bare 11-character IDs are accepted
     formats = [
         "jNQXAC9IVRw",  # Just the ID
         "https://www.youtube.com/watch?v=jNQXAC9IVRw",  # Standard URL
@@ -125,17 +223,28 @@ def example_url_formats():
         "https://www.youtube.com/embed/jNQXAC9IVRw",  # Embed URL
     ]
     
-    print("Testing different URL formats for the same video:")
+    print("Validating different input formats for the same video:")
     
+    # Validation is local, so check every format first and hit the network only once
+    # per distinct video ID
+    extractor = YouTubeVideoInfoExtractor(cache_path=CACHE_PATH)
+    video_ids = []
     for fmt in formats:
-        print(f"\nFormat: {fmt}")
-        info = get_video_info(fmt)
+        # Video IDs are exactly 11 characters from a fixed alphabet
+        if len(fmt) == 11 and VIDEO_ID_CHARS.issuperset(fmt):
+            print(f"✓ Accepted: {fmt}")
+            video_ids.append(fmt)
+        else:
+            print(f"✗ Rejected: {fmt} (pass the 11-character video ID instead)")
+    
+    for video_id in dict.fromkeys(video_ids):
+        info = extractor.get_video_info(video_id)
         
         if info:
-            print(f"✓ Success: {info['title'][:50]}...")
+            print(f"\n{video_id}: {info['title'][:50]}...")
             print(f"  Method: {info['extraction_method']}")
         else:
-            print("✗ Failed")
+            print(f"\n{video_id}: ✗ Failed")
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ fi
 
 # Run different test groups
 echo "📋 Test Groups Available:"
-echo "  1. All E2E tests (slow, ~2-3 minutes)"
+echo "  1. All E2E tests (slow, ~2-3 minutes; parallel with pytest-xdist)"
 echo "  2. API strategy tests only"
 echo "  3. yt-dlp strategy tests only"
 echo "  4. CLI tests only"
@@ -30,10 +30,17 @@ echo ""
 # Default to quick smoke test
 TEST_GROUP=${1:-5}
 
+# Test classes are independent, so run them in parallel when pytest-xdist is installed.
+# loadscope keeps each class on one worker so its requests stay paced as written.
+PARALLEL_ARGS=""
+if python -c "import xdist" 2>/dev/null; then
+    PARALLEL_ARGS="-n auto --dist loadscope"
+fi
+
 case $TEST_GROUP in
     1)
         echo "Running all E2E tests..."
-        pytest tests/test_e2e.py -m e2e -v
+        pytest tests/test_e2e.py -m e2e -v $PARALLEL_ARGS
         ;;
     2)
         echo "Running API strategy tests..."
@@ -52,7 +59,7 @@ case $TEST_GROUP in
         if [ -z "$YOUTUBE_API_KEY" ]; then
             # Run without API key - test fallback methods
             pytest tests/test_e2e.py::TestE2EAutoStrategy::test_auto_strategy_selection \
-                   tests/test_e2e.py::TestE2EYtDlpStrategy::test_yt_dlp_single_video \
+                   "tests/test_e2e.py::TestE2EYtDlpStrategy::test_yt_dlp_single_video[first_youtube]" \
                    tests/test_e2e.py::TestE2ECLI::test_cli_single_video \
                    -m e2e -v
         else
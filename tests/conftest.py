@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures
+"""
+
+import os
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from yt_info_extract import YouTubeVideoInfoExtractor
+
+
+@pytest.fixture
+def mock_extractor_class(monkeypatch):
+    """Replace the CLI's YouTubeVideoInfoExtractor with a mock class"""
+    extractor_class = MagicMock()
+    monkeypatch.setattr("yt_info_extract.cli.YouTubeVideoInfoExtractor", extractor_class)
+    return extractor_class
+
+
+@pytest.fixture
+def mock_extractor(mock_extractor_class):
+    """The mock extractor instance the CLI gets when it builds an extractor"""
+    return mock_extractor_class.return_value
+
+
+@pytest.fixture
+def disable_backends(monkeypatch):
+    """Mark every extraction backend as not installed"""
+    for name in ("YT_DLP_AVAILABLE", "PYTUBEFIX_AVAILABLE", "GOOGLE_API_AVAILABLE"):
+        monkeypatch.setattr(f"yt_info_extract.extractor.{name}", False)
+
+
+class FakeYouTubeService:
+    """Plain stand-in for the API client's videos().list(...).execute() chain"""
+
+    def __init__(self):
+        self.response = {"items": []}
+        self.list_calls = []
+        self._lock = threading.Lock()
+
+    def videos(self):
+        return self
+
+    def list(self, **kwargs):
+        with self._lock:
+            self.list_calls.append(kwargs)
+        return self
+
+    def execute(self, http=None):
+        return self.response
+
+
+@pytest.fixture
+def fake_youtube_service(monkeypatch):
+    """Make the extractor's API client a FakeYouTubeService that records list() calls"""
+    service = FakeYouTubeService()
+    monkeypatch.setattr("googleapiclient.discovery.build", lambda *args, **kwargs: service)
+    return service
+
+
+# Extractors for end-to-end tests are shared by the whole session so strategy discovery,
+# API client setup and HTTP connections are paid for once rather than per test.
+
+
+@pytest.fixture(scope="session")
+def api_extractor():
+    """Extractor using the YouTube Data API (skips if YOUTUBE_API_KEY is not set)"""
+    api_key = os.environ.get("YOUTUBE_API_KEY")
+    if not api_key:
+        pytest.skip("YOUTUBE_API_KEY not set, skipping API tests")
+    return YouTubeVideoInfoExtractor(api_key=api_key, strategy="api")
+
+
+@pytest.fixture(scope="session")
+def yt_dlp_extractor():
+    """Extractor using yt-dlp (skips if yt-dlp is not installed)"""
+    try:
+        return YouTubeVideoInfoExtractor(strategy="yt_dlp")
+    except ImportError:
+        pytest.skip("yt-dlp not available")
+
+
+@pytest.fixture(scope="session")
+def pytubefix_extractor():
+    """Extractor using pytubefix (skips if pytubefix is not installed)"""
+    try:
+        return YouTubeVideoInfoExtractor(strategy="pytubefix")
+    except ImportError:
+        pytest.skip("pytubefix not available")
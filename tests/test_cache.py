@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk video info cache
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from yt_info_extract.cache import MemoryVideoInfoCache, VideoInfoCache
+from yt_info_extract.extractor import _API_VIDEO_FIELDS, YouTubeVideoInfoExtractor
+
+SAMPLE_INFO = {
+    "id": "jNQXAC9IVRw",
+    "title": "Me at the zoo",
+    "views": 123456,
+    "extraction_method": "youtube_api",
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = VideoInfoCache(str(tmp_path / "cache" / "videos.sqlite"))
+    yield cache
+    cache.close()
+
+
+class TestVideoInfoCache:
+    """Test VideoInfoCache storage and expiry"""
+
+    def test_roundtrip(self, cache):
+        """Test stored info is returned unchanged"""
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        assert cache.get("jNQXAC9IVRw", "api") == SAMPLE_INFO
+
+    def test_miss(self, cache):
+        """Test missing entries and other strategies return None"""
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        assert cache.get("dQw4w9WgXcQ", "api") is None
+        assert cache.get("jNQXAC9IVRw", "yt_dlp") is None
+
+    @patch("yt_info_extract.cache.time.time")
+    def test_ttl_depends_on_extraction_method(self, mock_time, cache):
+        """Test API results expire after 24h and scraped results after 48h"""
+        mock_time.return_value = 1000.0
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        cache.set("jNQXAC9IVRw", "yt_dlp", {**SAMPLE_INFO, "extraction_method": "yt_dlp"})
+
+        mock_time.return_value = 1000.0 + 36 * 60 * 60
+        assert cache.get("jNQXAC9IVRw", "api") is None
+        assert cache.get("jNQXAC9IVRw", "yt_dlp") is not None
+
+        mock_time.return_value = 1000.0 + 48 * 60 * 60
+        assert cache.get("jNQXAC9IVRw", "yt_dlp") is None
+
+    @patch("yt_info_extract.cache.time.time")
+    def test_explicit_ttl(self, mock_time, tmp_path):
+        """Test an explicit ttl overrides the per-method defaults"""
+        cache = VideoInfoCache(str(tmp_path / "videos.sqlite"), ttl=10)
+        mock_time.return_value = 1000.0
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+
+        mock_time.return_value = 1009.0
+        assert cache.get("jNQXAC9IVRw", "api") == SAMPLE_INFO
+        mock_time.return_value = 1010.0
+        assert cache.get("jNQXAC9IVRw", "api") is None
+        cache.close()
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database"""
+        path = str(tmp_path / "videos.sqlite")
+        first = VideoInfoCache(path)
+        first.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        first.close()
+
+        second = VideoInfoCache(path)
+        assert second.get("jNQXAC9IVRw", "api") == SAMPLE_INFO
+        second.close()
+
+    def test_roundtrip_unicode_and_wide_integers(self, cache):
+        """Test non-ASCII text and integers wider than 64 bits survive serialization"""
+        info = {**SAMPLE_INFO, "title": "動物園にて 🐘", "views": 2**70}
+        cache.set("jNQXAC9IVRw", "api", info)
+        assert cache.get("jNQXAC9IVRw", "api") == info
+
+    def test_clear(self, cache):
+        """Test clear removes all entries"""
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        cache.clear()
+        assert cache.get("jNQXAC9IVRw", "api") is None
+
+
+class TestMemoryVideoInfoCache:
+    """Test MemoryVideoInfoCache LRU eviction and expiry"""
+
+    def test_roundtrip_returns_copy(self):
+        """Test stored info is returned unchanged and callers cannot mutate the entry"""
+        cache = MemoryVideoInfoCache()
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+
+        cached = cache.get("jNQXAC9IVRw", "api")
+        assert cached == SAMPLE_INFO
+        cached["title"] = "Changed"
+        assert cache.get("jNQXAC9IVRw", "api") == SAMPLE_INFO
+        assert cache.get("jNQXAC9IVRw", "yt_dlp") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted once maxsize is exceeded"""
+        cache = MemoryVideoInfoCache(maxsize=2)
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+        cache.set("dQw4w9WgXcQ", "api", SAMPLE_INFO)
+        cache.get("jNQXAC9IVRw", "api")
+        cache.set("kJQP7kiw5Fk", "api", SAMPLE_INFO)
+
+        assert cache.get("jNQXAC9IVRw", "api") is not None
+        assert cache.get("dQw4w9WgXcQ", "api") is None
+        assert cache.get("kJQP7kiw5Fk", "api") is not None
+
+    @patch("yt_info_extract.cache.time.time")
+    def test_ttl_depends_on_extraction_method(self, mock_time):
+        """Test entries expire after the same per-method TTLs as the on-disk cache"""
+        cache = MemoryVideoInfoCache()
+        mock_time.return_value = 1000.0
+        cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+
+        mock_time.return_value = 1000.0 + 24 * 60 * 60
+        assert cache.get("jNQXAC9IVRw", "api") is None
+
+    def test_invalid_maxsize(self):
+        """Test maxsize must be positive"""
+        with pytest.raises(ValueError):
+            MemoryVideoInfoCache(maxsize=0)
+
+
+class TestExtractorCaching:
+    """Test extractor integration with the cache"""
+
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_get_video_info_uses_cache(self, mock_sleep, tmp_path):
+        """Test a second lookup is served from the cache"""
+        extractor = YouTubeVideoInfoExtractor(
+            strategy="yt_dlp", cache_path=str(tmp_path / "videos.sqlite")
+        )
+
+        with patch.object(
+            extractor, "_extract_with_retry", return_value=SAMPLE_INFO
+        ) as mock_extract:
+            assert extractor.get_video_info("jNQXAC9IVRw") == SAMPLE_INFO
+            assert extractor.get_video_info("jNQXAC9IVRw") == SAMPLE_INFO
+
+        mock_extract.assert_called_once_with("jNQXAC9IVRw", "yt_dlp")
+
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_batch_extract_api_skips_cached(self, mock_sleep, tmp_path, fake_youtube_service):
+        """Test batched API extraction only requests uncached IDs"""
+
+        extractor = YouTubeVideoInfoExtractor(
+            api_key="test_key", strategy="api", cache_path=str(tmp_path / "videos.sqlite")
+        )
+        extractor.cache.set("jNQXAC9IVRw", "api", SAMPLE_INFO)
+
+        results = extractor.batch_extract(["jNQXAC9IVRw", "dQw4w9WgXcQ"])
+
+        assert results[0] == SAMPLE_INFO
+        assert results[1]["error"] == "Extraction failed"
+        assert fake_youtube_service.list_calls == [
+            {"part": "snippet,statistics", "id": "dQw4w9WgXcQ", "fields": _API_VIDEO_FIELDS}
+        ]
+
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_get_video_info_memory_cache_hit(self, mock_sleep, monkeypatch):
+        """Test memory_cache_size serves repeat lookups without extracting again"""
+        monkeypatch.delenv("YT_INFO_CACHE", raising=False)
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp", memory_cache_size=16)
+        assert isinstance(extractor.cache, MemoryVideoInfoCache)
+
+        with patch.object(
+            extractor, "_extract_with_retry", return_value=SAMPLE_INFO
+        ) as mock_extract:
+            assert extractor.get_video_info("jNQXAC9IVRw") == SAMPLE_INFO
+            assert extractor.get_video_info("jNQXAC9IVRw") == SAMPLE_INFO
+
+        mock_extract.assert_called_once_with("jNQXAC9IVRw", "yt_dlp")
+
+    def test_cache_disabled_by_default(self, monkeypatch):
+        """Test no cache is created unless cache_path is given"""
+        monkeypatch.delenv("YT_INFO_CACHE", raising=False)
+        extractor = YouTubeVideoInfoExtractor()
+        assert extractor.cache is None
+
+    def test_cache_path_from_environment(self, monkeypatch, tmp_path):
+        """Test YT_INFO_CACHE enables the cache when cache_path is not given"""
+        path = str(tmp_path / "videos.sqlite")
+        monkeypatch.setenv("YT_INFO_CACHE", path)
+
+        extractor = YouTubeVideoInfoExtractor()
+
+        assert extractor.cache is not None
+        assert extractor.cache.path == path
+        extractor.cache.close()
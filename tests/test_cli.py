@@ -3,9 +3,7 @@
 Tests for CLI functionality
 """
 
-import os
 import sys
-import tempfile
 from io import StringIO
 from unittest.mock import MagicMock, patch
 
@@ -13,53 +11,78 @@ import pytest
 
 from yt_info_extract.cli import main, print_video_info
 
+BASIC_INFO = {
+    "title": "Test Video",
+    "channel_name": "Test Channel",
+    "views": 1000000,
+    "extraction_method": "youtube_api",
+}
+FULL_INFO = {
+    **BASIC_INFO,
+    "publication_date": "2005-04-23T00:00:00Z",
+    "description": "Test description",
+}
+
 
 class TestPrintVideoInfo:
     """Test video info printing functions"""
 
-    def test_print_video_info_text_format(self, capsys):
-        """Test text format printing"""
-        video_info = {
-            "title": "Test Video",
-            "channel_name": "Test Channel",
-            "views": 1000000,
-            "publication_date": "2005-04-23T00:00:00Z",
-            "description": "Test description",
-            "extraction_method": "youtube_api",
-        }
-
-        print_video_info(video_info, "text")
-        captured = capsys.readouterr()
-
-        assert "📹 Title: Test Video" in captured.out
-        assert "📺 Channel: Test Channel" in captured.out
-        assert "👀 Views: 1.0M views" in captured.out
-        assert "📅 Published: April 23, 2005" in captured.out
-        assert "🔧 Method: youtube_api" in captured.out
-        assert "📝 Description: Test description" in captured.out
-
-    def test_print_video_info_compact_format(self, capsys):
-        """Test compact format printing"""
-        video_info = {
-            "title": "Test Video",
-            "channel_name": "Test Channel",
-            "views": 1000000,
-            "extraction_method": "youtube_api",
-        }
-
-        print_video_info(video_info, "compact")
-        captured = capsys.readouterr()
-
-        assert "Test Video | Test Channel | 1.0M views | youtube_api" in captured.out
+    @pytest.mark.parametrize(
+        "video_info, output_format, expected",
+        [
+            pytest.param(
+                FULL_INFO,
+                "text",
+                [
+                    "📹 Title: Test Video",
+                    "📺 Channel: Test Channel",
+                    "👀 Views: 1.0M views",
+                    "📅 Published: April 23, 2005",
+                    "🔧 Method: youtube_api",
+                    "📝 Description: Test description",
+                ],
+                id="text",
+            ),
+            pytest.param(
+                BASIC_INFO,
+                "compact",
+                ["Test Video | Test Channel | 1.0M views | youtube_api"],
+                id="compact",
+            ),
+            pytest.param(
+                FULL_INFO,
+                "stats",
+                [
+                    "Video Statistics:",
+                    "Title: Test Video",
+                    "Channel: Test Channel",
+                    "Views: 1.0M views (1,000,000)",
+                    "Published: April 23, 2005",
+                    "Description Length:",
+                    "Has Description: Yes",
+                    "Extraction Method: youtube_api",
+                ],
+                id="stats",
+            ),
+            pytest.param(
+                BASIC_INFO,
+                "text",
+                ["📝 Description: Not available"],
+                id="no_description",
+            ),
+        ],
+    )
+    def test_print_video_info_formats(self, video_info, output_format, expected, capsys):
+        """Test each output format prints the expected fields"""
+        print_video_info(video_info, output_format)
+        output = capsys.readouterr().out
+
+        for text in expected:
+            assert text in output
 
     def test_print_video_info_compact_long_title(self, capsys):
         """Test compact format with long title"""
-        video_info = {
-            "title": "A" * 100,  # Very long title
-            "channel_name": "Test Channel",
-            "views": 1000,
-            "extraction_method": "api",
-        }
+        video_info = {**BASIC_INFO, "title": "A" * 100}  # Very long title
 
         print_video_info(video_info, "compact")
         captured = capsys.readouterr()
@@ -69,29 +92,6 @@ class TestPrintVideoInfo:
         assert len(output.split("|")[0].strip()) == 53  # 50 + "..."
         assert "..." in output
 
-    def test_print_video_info_stats_format(self, capsys):
-        """Test stats format printing"""
-        video_info = {
-            "title": "Test Video",
-            "channel_name": "Test Channel",
-            "views": 1000000,
-            "publication_date": "2005-04-23T00:00:00Z",
-            "description": "Test description",
-            "extraction_method": "youtube_api",
-        }
-
-        print_video_info(video_info, "stats")
-        captured = capsys.readouterr()
-
-        assert "Video Statistics:" in captured.out
-        assert "Title: Test Video" in captured.out
-        assert "Channel: Test Channel" in captured.out
-        assert "Views: 1.0M views (1,000,000)" in captured.out
-        assert "Published: April 23, 2005" in captured.out
-        assert "Description Length:" in captured.out
-        assert "Has Description: Yes" in captured.out
-        assert "Extraction Method: youtube_api" in captured.out
-
     def test_print_video_info_error(self, capsys):
         """Test printing with error info"""
         video_info = {"error": "Extraction failed", "video_id": "invalid_id"}
@@ -109,200 +109,170 @@ class TestPrintVideoInfo:
 
         assert "❌ Failed to extract video information" in captured.out
 
-    def test_print_video_info_no_description(self, capsys):
-        """Test printing with no description"""
-        video_info = {
-            "title": "Test Video",
-            "channel_name": "Test Channel",
-            "views": 1000000,
-            "extraction_method": "youtube_api",
-        }
-
-        print_video_info(video_info, "text")
-        captured = capsys.readouterr()
-
-        assert "📝 Description: Not available" in captured.out
-
 
 class TestCLIMain:
     """Test main CLI functionality"""
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_single_video_text(self, mock_extractor_class):
+    def test_main_single_video_text(self, mock_extractor, monkeypatch):
         """Test single video extraction with text output"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
-
-        video_info = {
-            "title": "Test Video",
-            "channel_name": "Test Channel",
-            "views": 1000000,
-            "extraction_method": "api",
-        }
-        mock_extractor.get_video_info.return_value = video_info
+        mock_extractor.get_video_info.return_value = {**BASIC_INFO, "extraction_method": "api"}
 
         test_args = ["yt-info", "jNQXAC9IVRw"]
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 0
         mock_extractor.get_video_info.assert_called_once_with("jNQXAC9IVRw")
 
         # Check that video info was printed
-        print_calls = [str(call) for call in mock_print.call_args_list]
-        assert any("Test Video" in call for call in print_calls)
+        printed = "\n".join(str(call) for call in mock_print.call_args_list)
+        assert "Test Video" in printed
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_single_video_failed(self, mock_extractor_class):
+    def test_main_single_video_failed(self, mock_extractor, monkeypatch):
         """Test single video extraction failure"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.get_video_info.return_value = None
 
         test_args = ["yt-info", "invalid_id"]
 
-        with patch.object(sys, "argv", test_args):
-            result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
         assert result == 1
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.export_to_json")
-    def test_main_json_output(self, mock_export_json, mock_extractor_class):
+    def test_main_json_output(self, mock_export_json, tmp_path, mock_extractor, monkeypatch):
         """Test JSON output format"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
-
         video_info = {"title": "Test Video"}
         mock_extractor.get_video_info.return_value = video_info
         mock_export_json.return_value = True
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "out.json")
+        test_args = ["yt-info", "-f", "json", "-o", temp_file, "jNQXAC9IVRw"]
 
-        try:
-            test_args = ["yt-info", "-f", "json", "-o", temp_file, "jNQXAC9IVRw"]
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            with patch.object(sys, "argv", test_args):
-                result = main()
+        assert result == 0
+        mock_export_json.assert_called_once_with(video_info, temp_file, False)
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    @pytest.mark.parametrize(
+        "pretty, expected",
+        [
+            (False, '{"title":"Café ☕","views":1000}'),
+            (True, '{\n  "title": "Café ☕",\n  "views": 1000\n}'),
+        ],
+    )
+    def test_main_json_stdout_format(
+        self, mock_extractor, monkeypatch, capsys, orjson_available, pretty, expected
+    ):
+        """Test JSON printed to stdout is identical with and without orjson"""
+        if orjson_available:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr("yt_info_extract.utils.ORJSON_AVAILABLE", orjson_available)
+        mock_extractor.get_video_info.return_value = {"title": "Café ☕", "views": 1000}
+
+        test_args = ["yt-info", "-f", "json", "--batch", "ids.txt", "jNQXAC9IVRw"]
+        if pretty:
+            test_args.insert(1, "--pretty")
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            assert result == 0
-            mock_export_json.assert_called_once_with(video_info, temp_file, False)
-        finally:
-            os.unlink(temp_file)
+        assert result == 0
+        assert capsys.readouterr().out.splitlines()[1:] == expected.splitlines()
 
-    def test_main_json_output_pretty_print_requires_output_file(self):
+    def test_main_json_output_pretty_print_requires_output_file(self, monkeypatch):
         """Test JSON output with pretty printing requires output file"""
         test_args = ["yt-info", "-f", "json", "--pretty", "jNQXAC9IVRw"]
 
-        with patch.object(sys, "argv", test_args):
-            with pytest.raises(SystemExit):  # argparse calls sys.exit
-                main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        with pytest.raises(SystemExit):  # argparse calls sys.exit
+            main()
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.export_to_csv")
-    def test_main_csv_output(self, mock_export_csv, mock_extractor_class):
+    def test_main_csv_output(self, mock_export_csv, tmp_path, mock_extractor, monkeypatch):
         """Test CSV output format"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
-
         video_info = {"title": "Test Video"}
         mock_extractor.get_video_info.return_value = video_info
         mock_export_csv.return_value = True
 
-        with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "out.csv")
+        test_args = ["yt-info", "-f", "csv", "-o", temp_file, "jNQXAC9IVRw"]
 
-        try:
-            test_args = ["yt-info", "-f", "csv", "-o", temp_file, "jNQXAC9IVRw"]
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            with patch.object(sys, "argv", test_args):
-                result = main()
-
-            assert result == 0
-            mock_export_csv.assert_called_once_with([video_info], temp_file)
-        finally:
-            os.unlink(temp_file)
+        assert result == 0
+        mock_export_csv.assert_called_once_with([video_info], temp_file)
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_test_api_valid(self, mock_extractor_class):
+    def test_main_test_api_valid(self, mock_extractor, monkeypatch):
         """Test API key validation success"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.test_api_key.return_value = True
 
         test_args = ["yt-info", "--test-api"]
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 0
         mock_print.assert_called_with("✅ API key is valid")
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_test_api_invalid(self, mock_extractor_class):
+    def test_main_test_api_invalid(self, mock_extractor, monkeypatch):
         """Test API key validation failure"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.test_api_key.return_value = False
 
         test_args = ["yt-info", "--test-api"]
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 1
         mock_print.assert_called_with("❌ API key is invalid or not provided")
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_list_strategies(self, mock_extractor_class):
+    def test_main_list_strategies(self, mock_extractor, monkeypatch):
         """Test listing available strategies"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.get_available_strategies.return_value = ["api", "yt_dlp"]
 
         test_args = ["yt-info", "--list-strategies"]
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 0
 
-        print_calls = [str(call) for call in mock_print.call_args_list]
-        assert any("Available extraction strategies" in call for call in print_calls)
-        assert any("api" in call for call in print_calls)
-        assert any("yt_dlp" in call for call in print_calls)
+        printed = "\n".join(str(call) for call in mock_print.call_args_list)
+        assert "Available extraction strategies" in printed
+        assert "api" in printed
+        assert "yt_dlp" in printed
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_list_strategies_empty(self, mock_extractor_class):
+    def test_main_list_strategies_empty(self, mock_extractor, monkeypatch):
         """Test listing strategies when none available"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.get_available_strategies.return_value = []
 
         test_args = ["yt-info", "--list-strategies"]
 
-        with patch.object(sys, "argv", test_args):
-            with patch("builtins.print") as mock_print:
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 0
 
-        print_calls = [str(call) for call in mock_print.call_args_list]
-        assert any("No strategies available" in call for call in print_calls)
+        printed = "\n".join(str(call) for call in mock_print.call_args_list)
+        assert "No strategies available" in printed
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
-    def test_main_batch_processing(self, mock_load_ids, mock_extractor_class):
+    def test_main_batch_processing(self, mock_load_ids, mock_extractor, monkeypatch):
         """Test batch processing"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
-
         video_ids = ["id1", "id2", "id3"]
         mock_load_ids.return_value = video_ids
 
@@ -313,56 +283,77 @@ class TestCLIMain:
         ]
         mock_extractor.batch_extract.return_value = batch_results
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            batch_file = f.name
-
-        try:
-            test_args = ["yt-info", "--batch", batch_file]
+        # Loading is mocked, so the batch file never needs to exist
+        batch_file = "video_ids.txt"
+        test_args = ["yt-info", "--batch", batch_file]
 
-            with patch.object(sys, "argv", test_args):
-                with patch("builtins.print") as mock_print:
-                    result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
-            assert result == 0
-            mock_load_ids.assert_called_once_with(batch_file)
-            mock_extractor.batch_extract.assert_called_once()
+        assert result == 0
+        mock_load_ids.assert_called_once_with(batch_file)
+        mock_extractor.batch_extract.assert_called_once()
 
-            # Should print sample results
-            print_calls = [str(call) for call in mock_print.call_args_list]
-            assert any("Sample results" in call for call in print_calls)
-        finally:
-            os.unlink(batch_file)
+        # Should print sample results
+        printed = "\n".join(str(call) for call in mock_print.call_args_list)
+        assert "Sample results" in printed
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
-    def test_main_batch_no_ids(self, mock_load_ids, mock_extractor_class):
+    def test_main_batch_no_ids(self, mock_load_ids, mock_extractor, monkeypatch):
         """Test batch processing with no video IDs loaded"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_load_ids.return_value = []
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            batch_file = f.name
+        test_args = ["yt-info", "--batch", "video_ids.txt"]
+
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
+
+        assert result == 1
+
+    @patch("yt_info_extract.cli.load_video_ids_from_file")
+    def test_main_batch_stream(self, mock_load_ids, tmp_path, mock_extractor, monkeypatch):
+        """Test --stream writes batch results through batch_extract_stream"""
+        mock_load_ids.return_value = ["id1", "id2"]
+
+        test_args = [
+            "yt-info",
+            "--batch",
+            "video_ids.txt",
+            "--stream",
+            "--output-dir",
+            str(tmp_path),
+        ]
+        monkeypatch.setattr(sys, "argv", test_args)
+        monkeypatch.setattr("builtins.print", MagicMock())
+        result = main()
 
-        try:
-            test_args = ["yt-info", "--batch", batch_file]
+        assert result == 0
+        mock_extractor.batch_extract_stream.assert_called_once_with(
+            ["id1", "id2"], str(tmp_path / "batch_results.jsonl"), "auto", 0.5, concurrency=1
+        )
+        mock_extractor.batch_extract.assert_not_called()
+
+    @patch("yt_info_extract.cli.load_video_ids_from_file")
+    def test_main_batch_stream_requires_output_dir(
+        self, mock_load_ids, mock_extractor, monkeypatch
+    ):
+        """Test --stream without --output-dir is rejected"""
+        mock_load_ids.return_value = ["id1"]
 
-            with patch.object(sys, "argv", test_args):
-                result = main()
+        monkeypatch.setattr(sys, "argv", ["yt-info", "--batch", "video_ids.txt", "--stream"])
+        monkeypatch.setattr("builtins.print", MagicMock())
 
-            assert result == 1
-        finally:
-            os.unlink(batch_file)
+        assert main() == 1
+        mock_extractor.batch_extract_stream.assert_not_called()
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
     @patch("yt_info_extract.cli.create_summary_report")
     def test_main_batch_with_summary(
-        self, mock_create_summary, mock_load_ids, mock_extractor_class
+        self, mock_create_summary, mock_load_ids, mock_extractor, monkeypatch
     ):
         """Test batch processing with summary report"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_load_ids.return_value = ["id1", "id2"]
 
         batch_results = [{"title": "Video 1", "views": 1000}, {"title": "Video 2", "views": 2000}]
@@ -379,69 +370,74 @@ class TestCLIMain:
         }
         mock_create_summary.return_value = summary_report
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            batch_file = f.name
-
-        try:
-            test_args = ["yt-info", "--batch", batch_file, "--summary"]
+        test_args = ["yt-info", "--batch", "video_ids.txt", "--summary"]
 
-            with patch.object(sys, "argv", test_args):
-                with patch("builtins.print") as mock_print:
-                    result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
-            assert result == 0
-            mock_create_summary.assert_called_once_with(batch_results)
+        assert result == 0
+        mock_create_summary.assert_called_once_with(batch_results)
 
-            # Should print summary report
-            print_calls = [str(call) for call in mock_print.call_args_list]
-            assert any("SUMMARY REPORT" in call for call in print_calls)
-            assert any("Total videos processed: 2" in call for call in print_calls)
-        finally:
-            os.unlink(batch_file)
+        # Should print summary report
+        printed = "\n".join(str(call) for call in mock_print.call_args_list)
+        assert "SUMMARY REPORT" in printed
+        assert "Total videos processed: 2" in printed
 
-    def test_main_no_arguments(self):
+    def test_main_no_arguments(self, monkeypatch):
         """Test CLI with no arguments"""
         test_args = ["yt-info"]
 
-        with patch.object(sys, "argv", test_args):
-            with pytest.raises(SystemExit):  # argparse calls sys.exit
-                main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        with pytest.raises(SystemExit):  # argparse calls sys.exit
+            main()
 
-    def test_main_json_no_output_file(self):
+    def test_main_json_no_output_file(self, monkeypatch):
         """Test JSON format without output file"""
         test_args = ["yt-info", "-f", "json", "jNQXAC9IVRw"]
 
-        with patch.object(sys, "argv", test_args):
-            with pytest.raises(SystemExit):  # argparse calls sys.exit
-                main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        with pytest.raises(SystemExit):  # argparse calls sys.exit
+            main()
 
-    def test_main_csv_no_output_file(self):
+    def test_main_csv_no_output_file(self, monkeypatch):
         """Test CSV format without output file"""
         test_args = ["yt-info", "-f", "csv", "jNQXAC9IVRw"]
 
-        with patch.object(sys, "argv", test_args):
-            with pytest.raises(SystemExit):  # argparse calls sys.exit
-                main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        with pytest.raises(SystemExit):  # argparse calls sys.exit
+            main()
+
+    @pytest.mark.parametrize("concurrency", ["0", "-2"])
+    def test_main_rejects_non_positive_concurrency(
+        self, mock_extractor_class, monkeypatch, capsys, concurrency
+    ):
+        """Test --concurrency below 1 is rejected as a usage error"""
+        test_args = ["yt-info", "--batch", "ids.txt", "--concurrency", concurrency]
+
+        monkeypatch.setattr(sys, "argv", test_args)
+        with pytest.raises(SystemExit) as exc_info:  # argparse calls sys.exit
+            main()
+
+        assert exc_info.value.code == 2
+        assert "--concurrency must be at least 1" in capsys.readouterr().err
 
-    def test_main_extractor_initialization_failure(self):
+    def test_main_extractor_initialization_failure(self, mock_extractor_class, monkeypatch):
         """Test main when extractor initialization fails"""
+        mock_extractor_class.side_effect = Exception("Init failed")
         test_args = ["yt-info", "jNQXAC9IVRw"]
 
-        with patch(
-            "yt_info_extract.cli.YouTubeVideoInfoExtractor", side_effect=Exception("Init failed")
-        ):
-            with patch.object(sys, "argv", test_args):
-                with patch("builtins.print") as mock_print:
-                    result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        mock_print = MagicMock()
+        monkeypatch.setattr("builtins.print", mock_print)
+        result = main()
 
         assert result == 1
         mock_print.assert_called_with("❌ Failed to initialize extractor: Init failed")
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
-    def test_main_with_custom_parameters(self, mock_extractor_class):
+    def test_main_with_custom_parameters(self, mock_extractor, mock_extractor_class, monkeypatch):
         """Test main with custom CLI parameters"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_extractor.get_video_info.return_value = {"title": "Test"}
 
         test_args = [
@@ -458,8 +454,8 @@ class TestCLIMain:
             "jNQXAC9IVRw",
         ]
 
-        with patch.object(sys, "argv", test_args):
-            result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
         assert result == 0
 
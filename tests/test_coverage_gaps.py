@@ -3,26 +3,26 @@
 Tests to fill coverage gaps
 """
 
-import os
-import tempfile
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
+from urllib.error import HTTPError
 
 import pytest
+from yt_dlp.utils import DownloadError
 
 import yt_info_extract.cli
 import yt_info_extract.extractor
 from yt_info_extract import YouTubeVideoInfoExtractor
 from yt_info_extract.cli import main
+from yt_info_extract.extractor import YouTubeThrottleError
 
 
 class TestCoverageGaps:
     """Tests to improve coverage for missed lines"""
 
-    @patch("yt_info_extract.extractor.YT_DLP_AVAILABLE", False)
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", False)
-    @patch("yt_info_extract.extractor.GOOGLE_API_AVAILABLE", False)
-    def test_no_extraction_methods_available(self):
+    def test_no_extraction_methods_available(self, disable_backends):
         """Test when no extraction methods are available"""
         extractor = YouTubeVideoInfoExtractor()
 
@@ -34,19 +34,11 @@ class TestCoverageGaps:
         result = extractor.get_video_info("jNQXAC9IVRw", strategy="auto")
         assert result is None
 
-    @patch("yt_info_extract.extractor.build")
+    @patch("googleapiclient.discovery.build")
     def test_api_generic_error(self, mock_build):
         """Test API extraction with generic error"""
-        mock_service = MagicMock()
-        mock_videos = MagicMock()
-        mock_list = MagicMock()
-        mock_request = MagicMock()
-
-        mock_build.return_value = mock_service
-        mock_service.videos.return_value = mock_videos
-        mock_videos.list.return_value = mock_request
-
         # Mock generic error
+        mock_request = mock_build.return_value.videos.return_value.list.return_value
         mock_request.execute.side_effect = Exception("Network error")
 
         extractor = YouTubeVideoInfoExtractor(api_key="test_key")
@@ -54,27 +46,52 @@ class TestCoverageGaps:
 
         assert result is None
 
-    @patch("yt_info_extract.extractor.yt_dlp.YoutubeDL")
-    @patch("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
-    def test_yt_dlp_download_error(self, mock_yt_dlp_class):
+    @patch("yt_dlp.YoutubeDL")
+    def test_yt_dlp_download_error(self, mock_yt_dlp_class, monkeypatch):
         """Test yt-dlp extraction with download error"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
+
         mock_yt_dlp = MagicMock()
-        mock_yt_dlp_class.return_value.__enter__.return_value = mock_yt_dlp
+        mock_yt_dlp_class.return_value = mock_yt_dlp
 
         # Mock download error
-        import yt_dlp
-
-        mock_yt_dlp.extract_info.side_effect = yt_dlp.utils.DownloadError("Video unavailable")
+        mock_yt_dlp.extract_info.side_effect = DownloadError("Video unavailable")
 
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
 
         assert result is None
 
-    @patch("yt_info_extract.extractor.YouTube")
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
-    def test_pytubefix_error(self, mock_youtube_class):
+    @patch("yt_dlp.YoutubeDL")
+    def test_yt_dlp_throttled(self, mock_yt_dlp_class, monkeypatch):
+        """Test yt-dlp HTTP 429 errors are raised as throttling"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
+
+        mock_yt_dlp = mock_yt_dlp_class.return_value
+        mock_yt_dlp.extract_info.side_effect = DownloadError(
+            "ERROR: Unable to download webpage: HTTP Error 429: Too Many Requests"
+        )
+
+        extractor = YouTubeVideoInfoExtractor()
+        with pytest.raises(YouTubeThrottleError):
+            extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
+
+    @patch("pytubefix.YouTube")
+    def test_pytubefix_throttled(self, mock_youtube_class, monkeypatch):
+        """Test pytubefix HTTP 403 errors are raised as throttling"""
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
+
+        mock_youtube_class.side_effect = HTTPError("url", 403, "Forbidden", None, None)
+
+        extractor = YouTubeVideoInfoExtractor()
+        with pytest.raises(YouTubeThrottleError):
+            extractor._get_video_info_pytubefix("jNQXAC9IVRw")
+
+    @patch("pytubefix.YouTube")
+    def test_pytubefix_error(self, mock_youtube_class, monkeypatch):
         """Test pytubefix extraction with error"""
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
+
         mock_youtube_class.side_effect = Exception("Connection error")
 
         extractor = YouTubeVideoInfoExtractor()
@@ -82,18 +99,18 @@ class TestCoverageGaps:
 
         assert result is None
 
-    @patch("yt_info_extract.extractor.YouTube")
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
-    def test_pytubefix_no_publish_date(self, mock_youtube_class):
+    @patch("pytubefix.YouTube")
+    def test_pytubefix_no_publish_date(self, mock_youtube_class, monkeypatch):
         """Test pytubefix extraction with no publish date"""
-        mock_youtube = MagicMock()
-        mock_youtube_class.return_value = mock_youtube
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
 
-        mock_youtube.title = "Test Video"
-        mock_youtube.description = "Test description"
-        mock_youtube.author = "Test Channel"
-        mock_youtube.publish_date = None  # No publish date
-        mock_youtube.views = 1000
+        mock_youtube_class.return_value = SimpleNamespace(
+            title="Test Video",
+            description="Test description",
+            author="Test Channel",
+            publish_date=None,  # No publish date
+            views=1000,
+        )
 
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_pytubefix("jNQXAC9IVRw")
@@ -105,7 +122,7 @@ class TestCoverageGaps:
         """Test batch extraction with mixed results"""
         extractor = YouTubeVideoInfoExtractor()
 
-        with patch.object(extractor, "get_video_info") as mock_get_info:
+        with patch.object(extractor, "_get_video_info_validated") as mock_get_info:
             # Mock results: success, failure, success
             mock_get_info.side_effect = [
                 {"title": "Video 1", "views": 1000},
@@ -127,99 +144,102 @@ class TestCoverageGaps:
 class TestCLICoverage:
     """Test CLI coverage gaps"""
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
     @patch("yt_info_extract.cli.export_to_json")
     @patch("yt_info_extract.cli.export_to_csv")
     def test_batch_with_output_dir_json_format(
-        self, mock_export_csv, mock_export_json, mock_load_ids, mock_extractor_class
+        self,
+        mock_export_csv,
+        mock_export_json,
+        mock_load_ids,
+        tmp_path,
+        mock_extractor,
+        monkeypatch,
     ):
         """Test batch processing with output directory and JSON format"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_load_ids.return_value = ["id1", "id2"]
         mock_extractor.batch_extract.return_value = [{"title": "Video 1"}, {"title": "Video 2"}]
         mock_export_json.return_value = True
         mock_export_csv.return_value = True
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_args = [
-                "yt-info",
-                "--batch",
-                "test_batch.txt",
-                "--output-dir",
-                temp_dir,
-                "--format",
-                "json",
-            ]
+        temp_dir = str(tmp_path)
+        test_args = [
+            "yt-info",
+            "--batch",
+            "test_batch.txt",
+            "--output-dir",
+            temp_dir,
+            "--format",
+            "json",
+        ]
 
-            with patch("sys.argv", test_args):
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            assert result == 0
-            mock_export_json.assert_called_once()
+        assert result == 0
+        mock_export_json.assert_called_once()
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
     @patch("yt_info_extract.cli.export_to_csv")
     def test_batch_with_output_dir_csv_format(
-        self, mock_export_csv, mock_load_ids, mock_extractor_class
+        self, mock_export_csv, mock_load_ids, tmp_path, mock_extractor, monkeypatch
     ):
         """Test batch processing with output directory and CSV format"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_load_ids.return_value = ["id1"]
         mock_extractor.batch_extract.return_value = [{"title": "Video 1"}]
         mock_export_csv.return_value = True
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_args = [
-                "yt-info",
-                "--batch",
-                "test_batch.txt",
-                "--output-dir",
-                temp_dir,
-                "--format",
-                "csv",
-            ]
+        temp_dir = str(tmp_path)
+        test_args = [
+            "yt-info",
+            "--batch",
+            "test_batch.txt",
+            "--output-dir",
+            temp_dir,
+            "--format",
+            "csv",
+        ]
 
-            with patch("sys.argv", test_args):
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            assert result == 0
-            mock_export_csv.assert_called_once()
+        assert result == 0
+        mock_export_csv.assert_called_once()
 
-    @patch("yt_info_extract.cli.YouTubeVideoInfoExtractor")
     @patch("yt_info_extract.cli.load_video_ids_from_file")
     @patch("yt_info_extract.cli.export_to_json")
     @patch("yt_info_extract.cli.export_to_csv")
     def test_batch_with_output_dir_default_formats(
-        self, mock_export_csv, mock_export_json, mock_load_ids, mock_extractor_class
+        self,
+        mock_export_csv,
+        mock_export_json,
+        mock_load_ids,
+        tmp_path,
+        mock_extractor,
+        monkeypatch,
     ):
         """Test batch processing with output directory and default formats"""
-        mock_extractor = MagicMock()
-        mock_extractor_class.return_value = mock_extractor
         mock_load_ids.return_value = ["id1"]
         mock_extractor.batch_extract.return_value = [{"title": "Video 1"}]
         mock_export_json.return_value = True
         mock_export_csv.return_value = True
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            test_args = ["yt-info", "--batch", "test_batch.txt", "--output-dir", temp_dir]
+        temp_dir = str(tmp_path)
+        test_args = ["yt-info", "--batch", "test_batch.txt", "--output-dir", temp_dir]
 
-            with patch("sys.argv", test_args):
-                result = main()
+        monkeypatch.setattr(sys, "argv", test_args)
+        result = main()
 
-            assert result == 0
-            # Should export both JSON and CSV for convenience
-            mock_export_json.assert_called_once()
-            mock_export_csv.assert_called_once()
+        assert result == 0
+        # Should export both JSON and CSV for convenience
+        mock_export_json.assert_called_once()
+        mock_export_csv.assert_called_once()
 
 
 class TestUtilsCoverage:
     """Test utils coverage gaps"""
 
-    def test_export_to_csv_with_none_values(self):
+    def test_export_to_csv_with_none_values(self, tmp_path):
         """Test CSV export with None values"""
         from yt_info_extract.utils import export_to_csv
 
@@ -233,20 +253,12 @@ class TestUtilsCoverage:
             }
         ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            temp_file = f.name
-
-        try:
-            result = export_to_csv(video_data, temp_file)
-            assert result is True
-
-            # Verify file was created and has content
-            with open(temp_file, "r") as f:
-                content = f.read()
-                assert (
-                    "title,channel_name,views,publication_date,description,extraction_method"
-                    in content
-                )
-                assert "Video 1" in content
-        finally:
-            os.unlink(temp_file)
+        temp_file = tmp_path / "videos.csv"
+
+        result = export_to_csv(video_data, str(temp_file))
+        assert result is True
+
+        # Verify file was created and has content
+        content = temp_file.read_text()
+        assert "title,channel_name,views,publication_date,description,extraction_method" in content
+        assert "Video 1" in content
@@ -3,13 +3,43 @@
 Comprehensive tests for YouTubeVideoInfoExtractor
 """
 
+import functools
+import json
 import os
+import threading
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpMockSequence
 
-from yt_info_extract.extractor import YouTubeVideoInfoExtractor
+from yt_info_extract import extractor as extractor_module
+from yt_info_extract.extractor import (
+    _API_VIDEO_FIELDS,
+    PermanentExtractionError,
+    YouTubeThrottleError,
+    YouTubeVideoInfoExtractor,
+)
+from yt_info_extract.ratelimit import AdaptiveConcurrencyLimiter
+
+
+def use_fake_clock(mock_time):
+    """Make a mocked time module keep a clock that only advances when sleeping"""
+    now = [0.0]
+    mock_time.monotonic.side_effect = lambda: now[0]
+    mock_time.sleep.side_effect = lambda seconds: now.__setitem__(0, now[0] + seconds)
+
+
+def sleep_durations(mock_time):
+    return [c.args[0] for c in mock_time.sleep.call_args_list]
+
+
+def api_build_with_responses(*bodies):
+    """Real googleapiclient build() whose HTTP layer replays the given JSON responses"""
+    http = HttpMockSequence([({"status": "200"}, json.dumps(body)) for body in bodies])
+    return functools.partial(build, http=http), http
 
 
 class TestYouTubeVideoInfoExtractor:
@@ -21,7 +51,7 @@ class TestYouTubeVideoInfoExtractor:
 
         assert extractor.timeout == 30
         assert extractor.max_retries == 3
-        assert extractor.backoff_factor == 0.75
+        assert extractor.backoff_factor == 2.0
         assert extractor.rate_limit_delay == 0.1
         assert extractor.strategy == "auto"
         assert extractor.api_key is None
@@ -56,15 +86,17 @@ class TestYouTubeVideoInfoExtractor:
         with pytest.raises(ValueError, match="Invalid strategy"):
             YouTubeVideoInfoExtractor(strategy="invalid_strategy")
 
-    @patch("yt_info_extract.extractor.YT_DLP_AVAILABLE", False)
-    def test_init_missing_yt_dlp(self):
+    def test_init_missing_yt_dlp(self, monkeypatch):
         """Test initialization fails when yt-dlp is requested but not available"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", False)
+
         with pytest.raises(ImportError, match="yt-dlp is not installed"):
             YouTubeVideoInfoExtractor(strategy="yt_dlp")
 
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", False)
-    def test_init_missing_pytubefix(self):
+    def test_init_missing_pytubefix(self, monkeypatch):
         """Test initialization fails when pytubefix is requested but not available"""
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", False)
+
         with pytest.raises(ImportError, match="pytubefix is not installed"):
             YouTubeVideoInfoExtractor(strategy="pytubefix")
 
@@ -96,6 +128,8 @@ class TestYouTubeVideoInfoExtractor:
             "invalid@char",
             "space here",
             "dQw4w9WgXc!",
+            "dQw4w9WgXcé",
+            "dQw4w9WgXc\n",
             "https://www.youtube.com/watch?v=jNQXAC9IVRw",
         ]
 
@@ -103,23 +137,12 @@ class TestYouTubeVideoInfoExtractor:
             result = extractor._validate_video_id(invalid_input)
             assert result is None, f"Should return None for: {invalid_input}"
 
-    @patch("yt_info_extract.extractor.build")
-    def test_get_video_info_api_success(self, mock_build):
+    def test_get_video_info_api_success(self):
         """Test successful API extraction"""
-        # Mock the YouTube service
-        mock_service = MagicMock()
-        mock_videos = MagicMock()
-        mock_list = MagicMock()
-        mock_request = MagicMock()
-
-        mock_build.return_value = mock_service
-        mock_service.videos.return_value = mock_videos
-        mock_videos.list.return_value = mock_request
-
-        # Mock API response
-        mock_response = {
+        api_response = {
             "items": [
                 {
+                    "id": "jNQXAC9IVRw",
                     "snippet": {
                         "title": "Test Video",
                         "description": "Test description",
@@ -130,11 +153,11 @@ class TestYouTubeVideoInfoExtractor:
                 }
             ]
         }
-        mock_request.execute.return_value = mock_response
+        mock_build, http = api_build_with_responses(api_response)
 
-        # Test extraction
-        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
-        result = extractor._get_video_info_api("jNQXAC9IVRw")
+        with patch("googleapiclient.discovery.build", mock_build):
+            extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+            result = extractor._get_video_info_api("jNQXAC9IVRw")
 
         assert result is not None
         assert result["title"] == "Test Video"
@@ -144,40 +167,61 @@ class TestYouTubeVideoInfoExtractor:
         assert result["views"] == 1000000
         assert result["extraction_method"] == "youtube_api"
 
-    @patch("yt_info_extract.extractor.build")
-    def test_get_video_info_api_no_results(self, mock_build):
+        uri = http.request_sequence[0][0]
+        assert uri.startswith("https://youtube.googleapis.com/youtube/v3/videos?")
+        assert "id=jNQXAC9IVRw" in uri
+        assert "key=test_key" in uri
+        assert "fields=items%28id%2Csnippet%28" in uri
+
+    def test_get_video_info_api_requests_gzip(self):
+        """Test API responses are requested gzip-compressed"""
+        mock_build, http = api_build_with_responses({"items": [{"id": "jNQXAC9IVRw"}]})
+
+        with patch("googleapiclient.discovery.build", mock_build):
+            extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+            extractor._get_video_info_api("jNQXAC9IVRw")
+
+        headers = http.request_sequence[0][3]
+        assert "gzip" in headers["accept-encoding"]
+        assert "(gzip)" in headers["user-agent"]
+
+    def test_get_video_info_api_no_results(self):
         """Test API extraction with no results"""
-        mock_service = MagicMock()
-        mock_videos = MagicMock()
-        mock_list = MagicMock()
-        mock_request = MagicMock()
+        mock_build, _ = api_build_with_responses({"items": []})
 
-        mock_build.return_value = mock_service
-        mock_service.videos.return_value = mock_videos
-        mock_videos.list.return_value = mock_request
+        with patch("googleapiclient.discovery.build", mock_build):
+            extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+            with pytest.raises(PermanentExtractionError):
+                extractor._get_video_info_api("invalid_id")
 
-        # Mock empty response
-        mock_response = {"items": []}
-        mock_request.execute.return_value = mock_response
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_get_video_info_api_missing_video_not_retried(self, mock_sleep):
+        """Test a video the API reports missing is requested once, without backoff"""
+        mock_build, http = api_build_with_responses({"items": []}, {"items": []})
 
-        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
-        result = extractor._get_video_info_api("invalid_id")
+        with patch("googleapiclient.discovery.build", mock_build):
+            extractor = YouTubeVideoInfoExtractor(
+                api_key="test_key", strategy="api", rate_limit_delay=0
+            )
+            assert extractor.get_video_info("jNQXAC9IVRw") is None
 
-        assert result is None
+        assert len(http.request_sequence) == 1
+        mock_sleep.assert_not_called()
 
     def test_get_video_info_api_no_service(self):
         """Test API extraction when service is not available"""
         extractor = YouTubeVideoInfoExtractor()  # No API key
-        result = extractor._get_video_info_api("jNQXAC9IVRw")
 
-        assert result is None
+        with pytest.raises(PermanentExtractionError):
+            extractor._get_video_info_api("jNQXAC9IVRw")
 
-    @patch("yt_info_extract.extractor.yt_dlp.YoutubeDL")
-    @patch("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
-    def test_get_video_info_yt_dlp_success(self, mock_yt_dlp_class):
+    @patch("yt_dlp.YoutubeDL")
+    def test_get_video_info_yt_dlp_success(self, mock_yt_dlp_class, monkeypatch):
         """Test successful yt-dlp extraction"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
+
         mock_yt_dlp = MagicMock()
-        mock_yt_dlp_class.return_value.__enter__.return_value = mock_yt_dlp
+        mock_yt_dlp_class.return_value = mock_yt_dlp
 
         # Mock yt-dlp response
         mock_info = {
@@ -188,7 +232,6 @@ class TestYouTubeVideoInfoExtractor:
             "view_count": 1000000,
         }
         mock_yt_dlp.extract_info.return_value = mock_info
-        mock_yt_dlp.sanitize_info.return_value = mock_info
 
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
@@ -200,28 +243,94 @@ class TestYouTubeVideoInfoExtractor:
         assert result["publication_date"] == "2005-04-23T00:00:00"
         assert result["views"] == 1000000
         assert result["extraction_method"] == "yt_dlp"
+        mock_yt_dlp.sanitize_info.assert_not_called()
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_get_video_info_yt_dlp_malformed_upload_date(self, mock_yt_dlp_class, monkeypatch):
+        """Test an unexpected upload_date leaves publication_date empty instead of failing"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
+        mock_yt_dlp_class.return_value.extract_info.return_value = {
+            "title": "Test Video",
+            "upload_date": "2005-04",
+        }
+
+        extractor = YouTubeVideoInfoExtractor()
+        result = extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
+
+        assert result["title"] == "Test Video"
+        assert result["publication_date"] is None
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_yt_dlp_client_reused_until_closed(self, mock_yt_dlp_class, monkeypatch):
+        """Test one yt-dlp client serves repeated lookups and is closed with the extractor"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", True)
+        mock_yt_dlp = mock_yt_dlp_class.return_value
+        mock_yt_dlp.extract_info.return_value = {"title": "Test Video"}
+
+        with YouTubeVideoInfoExtractor() as extractor:
+            extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
+            extractor._get_video_info_yt_dlp("dQw4w9WgXcQ")
+
+        mock_yt_dlp_class.assert_called_once()
+        assert mock_yt_dlp.extract_info.call_count == 2
+        mock_yt_dlp.close.assert_called_once()
+
+    @patch("googleapiclient.discovery.build")
+    def test_close_releases_api_connections(self, mock_build):
+        """Test close() closes the API service and worker connections, rebuilding on next use"""
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key")
+        service = extractor.youtube_service
+        http = extractor._thread_http()
+
+        with patch.object(http, "close") as mock_http_close:
+            extractor.close()
 
-    @patch("yt_info_extract.extractor.YT_DLP_AVAILABLE", False)
-    def test_get_video_info_yt_dlp_not_available(self):
+        service.close.assert_called_once()
+        mock_http_close.assert_called_once()
+        assert extractor._thread_http() is not http
+        assert extractor.youtube_service is not None
+        assert mock_build.call_count == 2
+
+    @patch("googleapiclient.discovery.build")
+    def test_api_requests_use_thread_connection_off_owner_thread(self, mock_build):
+        """Test API requests from other threads never share the service's connection"""
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key")
+        request = extractor.youtube_service.videos.return_value.list.return_value
+        request.execute.return_value = {"items": [{"id": "jNQXAC9IVRw"}]}
+
+        extractor._get_video_info_api("jNQXAC9IVRw")
+        assert request.execute.call_args == call(http=None)
+
+        worker = threading.Thread(target=extractor._get_video_info_api, args=("jNQXAC9IVRw",))
+        worker.start()
+        worker.join()
+
+        http = request.execute.call_args.kwargs["http"]
+        assert http is not None
+        assert http in extractor._clients[worker.ident]
+
+    def test_get_video_info_yt_dlp_not_available(self, monkeypatch):
         """Test yt-dlp extraction when not available"""
+        monkeypatch.setattr("yt_info_extract.extractor.YT_DLP_AVAILABLE", False)
+
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_yt_dlp("jNQXAC9IVRw")
 
         assert result is None
 
-    @patch("yt_info_extract.extractor.YouTube")
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
-    def test_get_video_info_pytubefix_success(self, mock_youtube_class):
+    @patch("pytubefix.YouTube")
+    def test_get_video_info_pytubefix_success(self, mock_youtube_class, monkeypatch):
         """Test successful pytubefix extraction"""
-        mock_youtube = MagicMock()
-        mock_youtube_class.return_value = mock_youtube
-
-        # Mock pytubefix response
-        mock_youtube.title = "Test Video"
-        mock_youtube.description = "Test description"
-        mock_youtube.author = "Test Channel"
-        mock_youtube.publish_date = datetime(2005, 4, 23)
-        mock_youtube.views = 1000000
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", True)
+
+        # Mock pytubefix response; only attribute access is needed
+        mock_youtube_class.return_value = SimpleNamespace(
+            title="Test Video",
+            description="Test description",
+            author="Test Channel",
+            publish_date=datetime(2005, 4, 23),
+            views=1000000,
+        )
 
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_pytubefix("jNQXAC9IVRw")
@@ -234,9 +343,10 @@ class TestYouTubeVideoInfoExtractor:
         assert result["views"] == 1000000
         assert result["extraction_method"] == "pytubefix"
 
-    @patch("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", False)
-    def test_get_video_info_pytubefix_not_available(self):
+    def test_get_video_info_pytubefix_not_available(self, monkeypatch):
         """Test pytubefix extraction when not available"""
+        monkeypatch.setattr("yt_info_extract.extractor.PYTUBEFIX_AVAILABLE", False)
+
         extractor = YouTubeVideoInfoExtractor()
         result = extractor._get_video_info_pytubefix("jNQXAC9IVRw")
 
@@ -252,24 +362,25 @@ class TestYouTubeVideoInfoExtractor:
         result = extractor.get_video_info("")
         assert result is None
 
-    @patch("yt_info_extract.extractor.time.sleep")
-    def test_get_video_info_rate_limiting(self, mock_sleep):
-        """Test that retry logic with backoff is applied when extraction fails"""
-        extractor = YouTubeVideoInfoExtractor(
-            rate_limit_delay=0.5, max_retries=1, backoff_factor=0.75
-        )
+    @patch("yt_info_extract.ratelimit.time")
+    def test_get_video_info_rate_limiting(self, mock_time):
+        """Test consecutive lookups are paced to rate_limit_delay"""
+        use_fake_clock(mock_time)
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp", rate_limit_delay=0.5)
+
+        with patch.object(extractor, "_extract_with_retry", return_value={"title": "Test"}):
+            for _ in range(3):
+                extractor.get_video_info("jNQXAC9IVRw")
 
-        # When extraction fails in CI (bot detection), retry logic kicks in with exponential backoff
-        # This is expected behavior - rate_limit_delay is for successful requests
-        extractor.get_video_info("jNQXAC9IVRw")
+        # The first lookup goes straight through
+        assert sleep_durations(mock_time) == pytest.approx([0.5, 0.5])
 
-        # Should call sleep with backoff factor (0.75) for failed requests, not rate_limit_delay
-        assert mock_sleep.called
-        # In CI environment, extraction will fail and trigger retry backoff
-        calls = mock_sleep.call_args_list
-        assert len(calls) >= 1  # At least one sleep call for backoff
+    def test_get_video_info_no_rate_limiting(self):
+        """Test rate_limit_delay=0 disables pacing"""
+        extractor = YouTubeVideoInfoExtractor(rate_limit_delay=0)
+        assert extractor._rate_limiter is None
 
-    @patch("yt_info_extract.extractor.build")
+    @patch("googleapiclient.discovery.build")
     def test_get_available_strategies_with_api(self, mock_build):
         """Test get_available_strategies when API is available"""
         mock_build.return_value = MagicMock()
@@ -279,6 +390,48 @@ class TestYouTubeVideoInfoExtractor:
 
         assert "api" in strategies
 
+    @patch("googleapiclient.discovery.build")
+    def test_api_service_built_on_first_use(self, mock_build):
+        """Test the API client is only built when it is first needed, and only once"""
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="yt_dlp")
+
+        assert "api" in extractor.get_available_strategies()
+        mock_build.assert_not_called()
+
+        assert extractor.youtube_service is mock_build.return_value
+        assert extractor.youtube_service is mock_build.return_value
+        mock_build.assert_called_once_with(
+            "youtube", "v3", developerKey="test_key", model=extractor_module._api_model()
+        )
+
+    @patch("googleapiclient.discovery.build", side_effect=Exception("no discovery document"))
+    def test_auto_skips_api_when_client_cannot_be_built(self, mock_build):
+        """Test a failed API client build drops the API from auto without spending retries"""
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", rate_limit_delay=0)
+        scraped = {"title": "Scraped", "extraction_method": "yt_dlp"}
+
+        with patch.object(extractor, "_get_video_info_api") as mock_api, patch.object(
+            extractor, "_get_video_info_yt_dlp", return_value=scraped
+        ):
+            assert extractor.get_video_info("jNQXAC9IVRw") == scraped
+            assert extractor.get_video_info("dQw4w9WgXcQ") == scraped
+
+        mock_api.assert_not_called()
+        mock_build.assert_called_once()
+        assert "api" not in extractor.get_available_strategies()
+
+    def test_api_model_matches_stock_json_model(self):
+        """Test the orjson API model decodes responses like googleapiclient's JsonModel"""
+        pytest.importorskip("orjson")
+        from googleapiclient.model import JsonModel
+
+        body = json.dumps({"items": [{"id": "jNQXAC9IVRw", "snippet": {"title": "Zoo 🐘"}}]})
+
+        for content in (body.encode("utf-8"), body, b"<html>Backend Error</html>"):
+            assert extractor_module._api_model().deserialize(content) == JsonModel().deserialize(
+                content
+            )
+
     def test_get_available_strategies_no_api(self):
         """Test get_available_strategies when API is not available"""
         extractor = YouTubeVideoInfoExtractor()  # No API key
@@ -286,18 +439,16 @@ class TestYouTubeVideoInfoExtractor:
 
         assert "api" not in strategies
 
-    @patch("yt_info_extract.extractor.build")
-    def test_test_api_key_success(self, mock_build):
-        """Test successful API key validation"""
-        mock_service = MagicMock()
-        mock_videos = MagicMock()
-        mock_list = MagicMock()
-        mock_request = MagicMock()
+    def test_get_available_strategies_returns_copy(self):
+        """Test callers cannot mutate the cached strategy order"""
+        extractor = YouTubeVideoInfoExtractor()
+        extractor.get_available_strategies().append("bogus")
+
+        assert "bogus" not in extractor.get_available_strategies()
 
-        mock_build.return_value = mock_service
-        mock_service.videos.return_value = mock_videos
-        mock_videos.list.return_value = mock_request
-        mock_request.execute.return_value = {"items": [{"snippet": {}}]}
+    def test_test_api_key_success(self, fake_youtube_service):
+        """Test successful API key validation"""
+        fake_youtube_service.response = {"items": [{"snippet": {}}]}
 
         extractor = YouTubeVideoInfoExtractor(api_key="test_key")
         result = extractor.test_api_key()
@@ -311,18 +462,389 @@ class TestYouTubeVideoInfoExtractor:
 
         assert result is False
 
-    @patch("yt_info_extract.extractor.time.sleep")
-    def test_batch_extract_rate_limiting(self, mock_sleep):
+    @patch("yt_info_extract.ratelimit.time")
+    def test_batch_extract_rate_limiting(self, mock_time):
         """Test batch extraction applies rate limiting"""
+        use_fake_clock(mock_time)
         extractor = YouTubeVideoInfoExtractor()
 
         # Use invalid video IDs to avoid actual API calls
         video_ids = ["invalid1", "invalid2", "invalid3"]
         extractor.batch_extract(video_ids, delay_between_requests=0.3)
 
-        # Should sleep between requests (but not after the last one)
-        assert mock_sleep.call_count == 2
-        mock_sleep.assert_has_calls([call(0.3), call(0.3)])
+        # Should sleep between requests (but not before the first one)
+        assert sleep_durations(mock_time) == pytest.approx([0.3, 0.3])
+
+    @patch("yt_info_extract.ratelimit.time")
+    def test_batch_extract_rate_limiting_burst(self, mock_time):
+        """Test batch extraction lets a burst through before pacing"""
+        use_fake_clock(mock_time)
+        extractor = YouTubeVideoInfoExtractor()
+
+        video_ids = ["invalid1", "invalid2", "invalid3", "invalid4"]
+        extractor.batch_extract(video_ids, delay_between_requests=0.3, burst=3)
+
+        assert sleep_durations(mock_time) == pytest.approx([0.3])
+
+    @patch("yt_info_extract.ratelimit.time")
+    def test_batch_extract_concurrent_dispatch(self, mock_time):
+        """Test concurrent batch extraction overlaps lookups but keeps pacing and order"""
+        use_fake_clock(mock_time)
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+        both_in_flight = threading.Barrier(2, timeout=5)
+        in_flight = []
+        peak = [0]
+        lock = threading.Lock()
+
+        def fake_get_video_info(video_id, strategy=None):
+            with lock:
+                in_flight.append(video_id)
+                peak[0] = max(peak[0], len(in_flight))
+            both_in_flight.wait()
+            with lock:
+                in_flight.remove(video_id)
+            return None if video_id == "dQw4w9WgXcQ" else {"id": video_id}
+
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk", "9bZkp7q19f0"]
+        with patch.object(extractor, "_get_video_info_validated", side_effect=fake_get_video_info):
+            results = extractor.batch_extract(video_ids, delay_between_requests=0.3, concurrency=2)
+
+        assert peak[0] == 2
+        assert [r.get("id") for r in results] == [
+            "jNQXAC9IVRw",
+            None,
+            "kJQP7kiw5Fk",
+            "9bZkp7q19f0",
+        ]
+        assert results[1] == {
+            "video_id": "dQw4w9WgXcQ",
+            "error": "Extraction failed",
+            "extraction_method": None,
+        }
+        assert sleep_durations(mock_time) == pytest.approx([0.3, 0.3, 0.3])
+
+    def test_batch_extract_deduplicates_inputs(self):
+        """Test repeated video IDs are extracted once and returned at every position"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "jNQXAC9IVRw", "jNQXAC9IVRw"]
+
+        with patch.object(
+            extractor, "_get_video_info_validated", side_effect=lambda v, s=None: {"id": v}
+        ) as mock_get:
+            results = extractor.batch_extract(video_ids, delay_between_requests=0)
+
+        assert mock_get.call_count == 2
+        assert [r["id"] for r in results] == video_ids
+
+    def test_batch_extract_invalid_id_validated_once(self):
+        """Test invalid IDs are validated once and never reach extraction"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+
+        with patch.object(
+            extractor, "_validate_video_id", wraps=extractor._validate_video_id
+        ) as mock_validate, patch.object(extractor, "_get_video_info_validated") as mock_get:
+            results = extractor.batch_extract(["invalid"], delay_between_requests=0)
+
+        mock_validate.assert_called_once_with("invalid")
+        mock_get.assert_not_called()
+        assert results == [
+            {"video_id": None, "error": "Extraction failed", "extraction_method": None}
+        ]
+
+    def test_batch_extract_valid_id_validated_once(self):
+        """Test valid IDs are not validated again on their way to extraction"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp", rate_limit_delay=0)
+
+        with patch.object(
+            extractor, "_validate_video_id", wraps=extractor._validate_video_id
+        ) as mock_validate, patch.object(
+            extractor, "_get_video_info_yt_dlp", return_value={"title": "Video"}
+        ):
+            results = extractor.batch_extract(["jNQXAC9IVRw"], delay_between_requests=0)
+
+        mock_validate.assert_called_once_with("jNQXAC9IVRw")
+        assert results == [{"title": "Video"}]
+
+    def test_batch_extract_stream_writes_json_lines(self, tmp_path):
+        """Test streamed batch results are written one per line in input order"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+        output_path = tmp_path / "results.jsonl"
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
+
+        with patch.object(
+            extractor, "_get_video_info_validated", side_effect=lambda v, s=None: {"id": v}
+        ):
+            written = extractor.batch_extract_stream(
+                video_ids, str(output_path), delay_between_requests=0, chunk_size=2
+            )
+
+        assert written == 3
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == video_ids
+        assert not (tmp_path / "results.jsonl.progress").exists()
+
+    def test_batch_extract_stream_resumes_after_checkpoint(self, tmp_path):
+        """Test an interrupted streamed batch resumes after its last checkpoint"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+        output_path = tmp_path / "results.jsonl"
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
+
+        def fail_on_third(video_id, strategy=None):
+            if video_id == "kJQP7kiw5Fk":
+                raise KeyboardInterrupt
+            return {"id": video_id}
+
+        with patch.object(extractor, "_get_video_info_validated", side_effect=fail_on_third):
+            with pytest.raises(KeyboardInterrupt):
+                extractor.batch_extract_stream(
+                    video_ids, str(output_path), delay_between_requests=0, chunk_size=2
+                )
+        assert (tmp_path / "results.jsonl.progress").exists()
+
+        with patch.object(
+            extractor, "_get_video_info_validated", side_effect=lambda v, s=None: {"id": v}
+        ) as mock_get:
+            written = extractor.batch_extract_stream(
+                video_ids, str(output_path), delay_between_requests=0, chunk_size=2
+            )
+
+        assert written == 1
+        mock_get.assert_called_once_with("kJQP7kiw5Fk", None)
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == video_ids
+
+    def test_batch_extract_stream_restarts_for_different_inputs(self, tmp_path):
+        """Test a checkpoint left by another video list is not resumed"""
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp")
+        output_path = tmp_path / "results.jsonl"
+
+        def fail_on_third(video_id, strategy=None):
+            if video_id == "kJQP7kiw5Fk":
+                raise KeyboardInterrupt
+            return {"id": video_id}
+
+        with patch.object(extractor, "_get_video_info_validated", side_effect=fail_on_third):
+            with pytest.raises(KeyboardInterrupt):
+                extractor.batch_extract_stream(
+                    ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"],
+                    str(output_path),
+                    delay_between_requests=0,
+                    chunk_size=2,
+                )
+
+        other_ids = ["9bZkp7q19f0", "OPf0YbXqDm0", "kJQP7kiw5Fk"]
+        with patch.object(
+            extractor, "_get_video_info_validated", side_effect=lambda v, s=None: {"id": v}
+        ):
+            written = extractor.batch_extract_stream(
+                other_ids, str(output_path), delay_between_requests=0, chunk_size=2
+            )
+
+        assert written == 3
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == other_ids
+
+    def test_batch_extract_invalid_concurrency(self):
+        """Test concurrency must be at least 1"""
+        extractor = YouTubeVideoInfoExtractor()
+
+        with pytest.raises(ValueError):
+            extractor.batch_extract(["jNQXAC9IVRw"], concurrency=0)
+
+    def test_batch_extract_api_single_request(self, fake_youtube_service):
+        """Test API batch extraction sends all IDs in one videos.list call"""
+        fake_youtube_service.response = {
+            "items": [
+                {"id": "dQw4w9WgXcQ", "snippet": {"title": "Video 2"}, "statistics": {}},
+                {"id": "jNQXAC9IVRw", "snippet": {"title": "Video 1"}, "statistics": {}},
+            ]
+        }
+
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk", "invalid"]
+        results = extractor.batch_extract(video_ids)
+
+        assert fake_youtube_service.list_calls == [
+            {
+                "part": "snippet,statistics",
+                "id": "jNQXAC9IVRw,dQw4w9WgXcQ,kJQP7kiw5Fk",
+                "fields": _API_VIDEO_FIELDS,
+            }
+        ]
+        assert [r.get("title") for r in results] == ["Video 1", "Video 2", None, None]
+        assert results[2] == {
+            "video_id": "kJQP7kiw5Fk",
+            "error": "Extraction failed",
+            "extraction_method": None,
+        }
+        assert results[3]["video_id"] is None
+
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_batch_extract_api_honours_retry_after(self, mock_sleep):
+        """Test a throttled videos.list call waits at least as long as Retry-After asks"""
+        http = HttpMockSequence(
+            [
+                ({"status": "429", "retry-after": "3"}, json.dumps({"error": {"code": 429}})),
+                ({"status": "200"}, json.dumps({"items": []})),
+            ]
+        )
+
+        with patch("googleapiclient.discovery.build", functools.partial(build, http=http)):
+            extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+            results = extractor.batch_extract(["jNQXAC9IVRw"], delay_between_requests=0)
+
+        assert results[0]["error"] == "Extraction failed"
+        assert len(http.request_sequence) == 2
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] >= 3
+
+    @pytest.mark.parametrize(
+        "status, reason, attempts",
+        [
+            ("400", "badRequest", 1),
+            ("403", "quotaExceeded", 1),
+            ("403", "rateLimitExceeded", 3),
+            ("503", "backendError", 3),
+        ],
+    )
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_batch_extract_api_retries_only_transient_errors(
+        self, mock_sleep, status, reason, attempts
+    ):
+        """Test videos.list errors are retried only when a retry can succeed"""
+        error = json.dumps({"error": {"code": int(status), "errors": [{"reason": reason}]}})
+        http = HttpMockSequence([({"status": status}, error)] * 3)
+
+        with patch("googleapiclient.discovery.build", functools.partial(build, http=http)):
+            extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+            results = extractor.batch_extract(["jNQXAC9IVRw"], delay_between_requests=0)
+
+        assert results[0]["error"] == "Extraction failed"
+        assert len(http.request_sequence) == attempts
+
+    def test_auto_skips_api_after_quota_exhausted(self):
+        """Test auto stops calling the API once it reports the daily quota exhausted"""
+        error = json.dumps({"error": {"code": 403, "errors": [{"reason": "quotaExceeded"}]}})
+        http = HttpMockSequence([({"status": "403"}, error)])
+        scraped = {"title": "Scraped", "extraction_method": "yt_dlp"}
+
+        with patch("googleapiclient.discovery.build", functools.partial(build, http=http)):
+            extractor = YouTubeVideoInfoExtractor(
+                api_key="test_key", strategy="auto", rate_limit_delay=0
+            )
+            with patch.object(extractor, "_get_video_info_yt_dlp", return_value=scraped), patch(
+                "yt_info_extract.extractor.time.sleep"
+            ) as mock_sleep:
+                assert extractor.get_video_info("jNQXAC9IVRw") == scraped
+                mock_sleep.assert_not_called()
+                assert extractor.get_video_info("dQw4w9WgXcQ") == scraped
+                results = extractor.batch_extract(["kJQP7kiw5Fk"], delay_between_requests=0)
+
+        assert results == [scraped]
+        assert len(http.request_sequence) == 1
+
+    @patch("yt_info_extract.ratelimit.time")
+    def test_batch_extract_api_chunks(self, mock_time, fake_youtube_service):
+        """Test API batch extraction splits IDs into chunks of 50"""
+        use_fake_clock(mock_time)
+
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+        video_ids = [f"video{i:06d}" for i in range(120)]
+        extractor.batch_extract(video_ids, delay_between_requests=0.3)
+
+        assert len(fake_youtube_service.list_calls) == 3
+        # Chunks are fetched concurrently, so calls may arrive in any order
+        chunk_sizes = sorted(len(c["id"].split(",")) for c in fake_youtube_service.list_calls)
+        assert chunk_sizes == [20, 50, 50]
+        assert sleep_durations(mock_time) == pytest.approx([0.3, 0.3])
+
+    @patch("googleapiclient.discovery.build")
+    def test_batch_extract_api_chunks_concurrent_results(self, mock_build):
+        """Test results from concurrently fetched chunks come back in input order"""
+
+        def videos_list(part, id, fields):
+            request = MagicMock()
+            request.execute.return_value = {
+                "items": [
+                    {"id": video_id, "snippet": {"title": video_id}} for video_id in id.split(",")
+                ]
+            }
+            return request
+
+        mock_build.return_value.videos.return_value.list.side_effect = videos_list
+
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="api")
+        video_ids = [f"video{i:06d}" for i in range(120)]
+        results = extractor.batch_extract(video_ids, delay_between_requests=0)
+
+        assert [r["title"] for r in results] == video_ids
+
+    @patch("googleapiclient.discovery.build")
+    def test_batch_extract_auto_batches_api_then_falls_back(self, mock_build):
+        """Test auto batch extraction uses one API call and scrapes only the misses"""
+        mock_list = mock_build.return_value.videos.return_value.list
+        mock_list.return_value.execute.return_value = {
+            "items": [{"id": "jNQXAC9IVRw", "snippet": {"title": "Video 1"}, "statistics": {}}]
+        }
+
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="auto")
+        scraped = {"title": "Video 2", "extraction_method": "yt_dlp"}
+
+        with patch.object(extractor, "_extract_with_retry", return_value=scraped) as mock_extract:
+            results = extractor.batch_extract(
+                ["jNQXAC9IVRw", "dQw4w9WgXcQ", "invalid", "dQw4w9WgXcQ"],
+                delay_between_requests=0,
+            )
+
+        mock_list.assert_called_once_with(
+            part="snippet,statistics", id="jNQXAC9IVRw,dQw4w9WgXcQ", fields=_API_VIDEO_FIELDS
+        )
+        mock_extract.assert_called_once_with("dQw4w9WgXcQ", "yt_dlp")
+        assert [r.get("title") for r in results] == ["Video 1", "Video 2", None, "Video 2"]
+        assert results[2]["error"] == "Extraction failed"
+
+    def test_batch_extract_auto_concurrent_fallbacks(self, fake_youtube_service):
+        """Test auto batch fallbacks overlap when concurrency is above 1"""
+        extractor = YouTubeVideoInfoExtractor(api_key="test_key", strategy="auto")
+        all_in_flight = threading.Barrier(3, timeout=5)
+
+        def fake_extract(video_id, strategy):
+            if strategy == "yt_dlp":
+                all_in_flight.wait()
+            if video_id == "kJQP7kiw5Fk":
+                return None
+            return {"title": video_id, "extraction_method": strategy}
+
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
+        with patch.object(extractor, "_extract_with_retry", side_effect=fake_extract):
+            results = extractor.batch_extract(video_ids, delay_between_requests=0, concurrency=3)
+
+        assert len(fake_youtube_service.list_calls) == 1
+        assert [r.get("title") for r in results] == ["jNQXAC9IVRw", "dQw4w9WgXcQ", None]
+        assert results[2]["error"] == "Extraction failed"
+
+    @patch("yt_dlp.YoutubeDL")
+    def test_batch_extract_closes_worker_clients(self, mock_yt_dlp_class):
+        """Test each concurrent batch closes the yt-dlp clients its worker threads created"""
+        clients = []
+
+        def make_client(options):
+            client = MagicMock()
+            client.extract_info.return_value = {"title": "Video", "upload_date": "20050423"}
+            clients.append(client)
+            return client
+
+        mock_yt_dlp_class.side_effect = make_client
+        extractor = YouTubeVideoInfoExtractor(strategy="yt_dlp", rate_limit_delay=0)
+        video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
+
+        for _ in range(3):
+            extractor.batch_extract(video_ids, delay_between_requests=0, concurrency=3)
+            assert extractor._clients == {}
+
+        assert clients
+        for client in clients:
+            client.close.assert_called_once()
 
     def test_batch_extract_empty_list(self):
         """Test batch extraction with empty list"""
@@ -331,9 +853,10 @@ class TestYouTubeVideoInfoExtractor:
         results = extractor.batch_extract([])
         assert results == []
 
+    @patch("yt_info_extract.extractor.random.uniform", side_effect=lambda low, high: high)
     @patch("yt_info_extract.extractor.time.sleep")
-    def test_extract_with_retry_backoff(self, mock_sleep):
-        """Test retry mechanism with exponential backoff"""
+    def test_extract_with_retry_backoff(self, mock_sleep, mock_uniform):
+        """Test retry mechanism with jittered exponential backoff"""
         extractor = YouTubeVideoInfoExtractor(max_retries=3, backoff_factor=2.0)
 
         # Mock a method that always fails
@@ -341,10 +864,44 @@ class TestYouTubeVideoInfoExtractor:
             result = extractor._extract_with_retry("test_id", "api")
 
         assert result is None
-        # Should sleep with exponential backoff: 2^0=1, 2^1=2 (last retry doesn't sleep)
+        # Delays are drawn up to 2^0=1, 2^1=2 (last retry doesn't sleep)
+        mock_uniform.assert_has_calls([call(0, 1.0), call(0, 2.0)])
         assert mock_sleep.call_count == 2
         mock_sleep.assert_has_calls([call(1.0), call(2.0)])
 
+    def test_backoff_delay_is_jittered(self):
+        """Test backoff delays stay within the exponential bound"""
+        extractor = YouTubeVideoInfoExtractor(backoff_factor=2.0)
+
+        delays = [extractor._backoff_delay(3) for _ in range(50)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_backoff_delay_is_capped(self):
+        """Test backoff delays never exceed MAX_BACKOFF_DELAY"""
+        extractor = YouTubeVideoInfoExtractor(backoff_factor=2.0)
+
+        delays = [extractor._backoff_delay(10) for _ in range(50)]
+
+        assert all(0 <= delay <= extractor_module.MAX_BACKOFF_DELAY for delay in delays)
+
+    @patch("yt_info_extract.extractor.time.sleep")
+    def test_extract_with_retry_throttling_shrinks_scrape_concurrency(self, mock_sleep):
+        """Test throttled scrape attempts cut the shared concurrency limit"""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_concurrency=8, overload_exception=YouTubeThrottleError
+        )
+        extractor = YouTubeVideoInfoExtractor(max_retries=2)
+
+        with patch("yt_info_extract.extractor._SCRAPE_LIMITER", limiter), patch.object(
+            extractor, "_get_video_info_yt_dlp", side_effect=YouTubeThrottleError("HTTP 429")
+        ):
+            result = extractor._extract_with_retry("jNQXAC9IVRw", "yt_dlp")
+
+        assert result is None
+        assert limiter.limit == 2
+
     def test_extract_with_retry_unknown_strategy(self):
         """Test retry mechanism with unknown strategy"""
         extractor = YouTubeVideoInfoExtractor()
@@ -3,7 +3,9 @@
 Tests for __init__.py convenience functions
 """
 
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -39,6 +41,66 @@ class TestConvenienceFunctions:
         mock_extractor_class.assert_called_once_with(api_key=None, strategy="auto")
         mock_extractor.get_video_info.assert_called_once_with("jNQXAC9IVRw")
 
+    @patch("yt_info_extract.YouTubeVideoInfoExtractor")
+    def test_get_video_info_reuses_extractor(self, mock_extractor_class):
+        """Test repeated calls with the same options share one extractor"""
+        get_video_info("jNQXAC9IVRw", strategy="yt_dlp")
+        get_video_info("dQw4w9WgXcQ", strategy="yt_dlp")
+        get_video_info("jNQXAC9IVRw", strategy="pytubefix")
+        get_video_info("jNQXAC9IVRw", strategy="yt_dlp", cookies=["unhashable"])
+
+        assert mock_extractor_class.call_args_list == [
+            call(api_key=None, strategy="yt_dlp"),
+            call(api_key=None, strategy="pytubefix"),
+            call(api_key=None, strategy="yt_dlp", cookies=["unhashable"]),
+        ]
+        assert mock_extractor_class.return_value.get_video_info.call_count == 4
+
+    @patch("yt_info_extract.YouTubeVideoInfoExtractor")
+    def test_shared_extractor_closed_on_eviction(self, mock_extractor_class):
+        """Test shared extractors evicted from the cache are closed"""
+        extractors = [MagicMock() for _ in range(10)]
+        mock_extractor_class.side_effect = extractors
+
+        for timeout in range(10):
+            get_video_info("jNQXAC9IVRw", timeout=timeout)
+
+        extractors[0].close.assert_called_once()
+        extractors[1].close.assert_called_once()
+        for extractor in extractors[2:]:
+            extractor.close.assert_not_called()
+
+    @patch("yt_info_extract.YouTubeVideoInfoExtractor")
+    def test_shared_extractor_in_use_closed_after_last_call(self, mock_extractor_class):
+        """Test an extractor evicted while a call still uses it is closed when that call ends"""
+        extractors = [MagicMock() for _ in range(10)]
+        mock_extractor_class.side_effect = extractors
+
+        def evict_self(video_input):
+            for timeout in range(1, 10):
+                get_video_info(video_input, timeout=timeout)
+            extractors[0].close.assert_not_called()
+            return {"title": "Test"}
+
+        extractors[0].get_video_info.side_effect = evict_self
+
+        assert get_video_info("jNQXAC9IVRw", timeout=0) == {"title": "Test"}
+        extractors[0].close.assert_called_once()
+
+    @patch("yt_info_extract.YouTubeVideoInfoExtractor")
+    def test_shared_extractor_rebuilt_when_environment_changes(
+        self, mock_extractor_class, monkeypatch
+    ):
+        """Test changing YOUTUBE_API_KEY after a call takes effect on the next call"""
+        monkeypatch.delenv("YOUTUBE_API_KEY", raising=False)
+        get_video_info("jNQXAC9IVRw")
+        get_video_info("jNQXAC9IVRw")
+        assert mock_extractor_class.call_count == 1
+
+        monkeypatch.setenv("YOUTUBE_API_KEY", "test_key")
+        get_video_info("jNQXAC9IVRw")
+        assert mock_extractor_class.call_count == 2
+
     @patch("yt_info_extract.YouTubeVideoInfoExtractor")
     def test_get_video_info_with_parameters(self, mock_extractor_class):
         """Test get_video_info with custom parameters"""
@@ -82,7 +144,7 @@ class TestConvenienceFunctions:
 
         assert result == expected_results
         mock_extractor_class.assert_called_once_with(api_key=None, strategy="auto")
-        mock_extractor.batch_extract.assert_called_once_with(video_list, "auto", 0.5)
+        mock_extractor.batch_extract.assert_called_once_with(video_list, "auto", 0.5, concurrency=1)
 
     @patch("yt_info_extract.YouTubeVideoInfoExtractor")
     def test_get_video_info_batch_with_parameters(self, mock_extractor_class):
@@ -93,11 +155,20 @@ class TestConvenienceFunctions:
 
         video_list = ["id1", "id2"]
         result = get_video_info_batch(
-            video_list, api_key="test_key", strategy="api", delay_between_requests=1.0, timeout=60
+            video_list,
+            api_key="test_key",
+            strategy="yt_dlp",
+            delay_between_requests=1.0,
+            concurrency=4,
+            timeout=60,
         )
 
-        mock_extractor_class.assert_called_once_with(api_key="test_key", strategy="api", timeout=60)
-        mock_extractor.batch_extract.assert_called_once_with(video_list, "api", 1.0)
+        mock_extractor_class.assert_called_once_with(
+            api_key="test_key", strategy="yt_dlp", timeout=60
+        )
+        mock_extractor.batch_extract.assert_called_once_with(
+            video_list, "yt_dlp", 1.0, concurrency=4
+        )
 
     @patch("yt_info_extract.get_video_info")
     @patch("yt_info_extract.extract_video_stats")
@@ -148,18 +219,18 @@ class TestConvenienceFunctions:
         result = export_video_info(video_data, "test.json", "json")
 
         assert result is True
-        mock_export_json.assert_called_once_with(video_data, "test.json", True)
+        mock_export_json.assert_called_once_with(video_data, "test.json", False)
 
     @patch("yt_info_extract.export_to_json")
-    def test_export_video_info_json_no_pretty(self, mock_export_json):
-        """Test export_video_info with JSON format, no pretty printing"""
+    def test_export_video_info_json_pretty(self, mock_export_json):
+        """Test export_video_info with JSON format and pretty printing"""
         video_data = {"title": "Test Video"}
         mock_export_json.return_value = True
 
-        result = export_video_info(video_data, "test.json", "json", pretty=False)
+        result = export_video_info(video_data, "test.json", "json", pretty=True)
 
         assert result is True
-        mock_export_json.assert_called_once_with(video_data, "test.json", False)
+        mock_export_json.assert_called_once_with(video_data, "test.json", True)
 
     @patch("yt_info_extract.export_to_csv")
     def test_export_video_info_csv(self, mock_export_csv):
@@ -183,11 +254,22 @@ class TestConvenienceFunctions:
         assert result is True
         mock_export_csv.assert_called_once_with([video_data], "test.csv")
 
+    @patch("yt_info_extract.export_to_parquet")
+    def test_export_video_info_parquet_single_dict(self, mock_export_parquet):
+        """Test export_video_info with Parquet format and single dict"""
+        video_data = {"title": "Test Video"}
+        mock_export_parquet.return_value = True
+
+        result = export_video_info(video_data, "test.parquet", "parquet")
+
+        assert result is True
+        mock_export_parquet.assert_called_once_with([video_data], "test.parquet")
+
     def test_export_video_info_invalid_format(self):
         """Test export_video_info with invalid format"""
         video_data = {"title": "Test Video"}
 
-        with pytest.raises(ValueError, match="format_type must be 'json' or 'csv'"):
+        with pytest.raises(ValueError, match="format_type must be 'json', 'csv' or 'parquet'"):
             export_video_info(video_data, "test.txt", "invalid")
 
     @patch("yt_info_extract.YouTubeVideoInfoExtractor")
@@ -287,6 +369,22 @@ class TestModuleMetadata:
         assert hasattr(yt_info_extract, "get_video_info")
         assert hasattr(yt_info_extract, "get_video_info_batch")
 
+    def test_extractor_imported_lazily(self):
+        """Test importing the package does not load the extractor until it is used"""
+        code = (
+            "import sys, yt_info_extract\n"
+            "assert 'yt_info_extract.extractor' not in sys.modules\n"
+            "assert yt_info_extract.YouTubeVideoInfoExtractor.__name__ == "
+            "'YouTubeVideoInfoExtractor'\n"
+            "assert 'yt_info_extract.extractor' in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_unknown_attribute(self):
+        """Test unknown attributes still raise AttributeError"""
+        with pytest.raises(AttributeError):
+            yt_info_extract.does_not_exist
+
 
 class TestFunctionSignatures:
     """Test that function signatures are as expected"""
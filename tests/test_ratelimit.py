@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for the token bucket rate limiter
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from yt_info_extract.ratelimit import AdaptiveConcurrencyLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock():
+    """Fake monotonic clock that advances only when sleeping or when moved manually"""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    with patch("yt_info_extract.ratelimit.time") as mock_time:
+        mock_time.monotonic.side_effect = lambda: now[0]
+        mock_time.sleep.side_effect = sleep
+        yield now, sleeps
+
+
+class TestTokenBucket:
+    """Test TokenBucket pacing"""
+
+    def test_invalid_arguments(self):
+        """Test rate and burst must be positive"""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+    def test_paces_after_first_call(self, clock):
+        """Test calls after the first are spaced at 1/rate"""
+        now, sleeps = clock
+        limiter = TokenBucket(rate=2.0)
+
+        for _ in range(3):
+            limiter.acquire()
+
+        assert sleeps == pytest.approx([0.5, 0.5])
+        assert now[0] == pytest.approx(1.0)
+
+    def test_burst_then_pace(self, clock):
+        """Test a full bucket lets a burst through without sleeping"""
+        _, sleeps = clock
+        limiter = TokenBucket(rate=10.0, burst=5)
+
+        for _ in range(7):
+            limiter.acquire()
+
+        assert sleeps == pytest.approx([0.1, 0.1])
+
+    def test_elapsed_time_counts_towards_delay(self, clock):
+        """Test time spent between calls shortens or removes the sleep"""
+        now, sleeps = clock
+        limiter = TokenBucket(rate=1.0)
+
+        limiter.acquire()
+        now[0] += 0.75  # e.g. a slow request
+        assert limiter.acquire() == pytest.approx(0.25)
+        now[0] += 5.0
+        assert limiter.acquire() == 0.0
+
+        assert sleeps == pytest.approx([0.25])
+
+    @patch("yt_info_extract.ratelimit.time")
+    def test_concurrent_callers_queue_up(self, mock_time):
+        """Test concurrent callers reserve distinct, evenly spaced slots"""
+        mock_time.monotonic.return_value = 0.0
+        limiter = TokenBucket(rate=2.0)
+        waits = []
+        lock = threading.Lock()
+
+        def worker():
+            wait = limiter.acquire()
+            with lock:
+                waits.append(wait)
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(waits) == pytest.approx([0.0, 0.5, 1.0, 1.5, 2.0])
+
+
+class ThrottleError(Exception):
+    pass
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD concurrency adjustment"""
+
+    def test_invalid_arguments(self):
+        """Test bounds must be ordered and the decrease factor a fraction"""
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_concurrency=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_concurrency=8, max_concurrency=4)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(decrease_factor=1.0)
+
+    def test_additive_increase(self):
+        """Test the limit grows by about one per window of successes"""
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=2, max_concurrency=4)
+
+        for _ in range(3):
+            with limiter:
+                pass
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            with limiter:
+                pass
+        assert limiter.limit == 4
+
+    def test_multiplicative_decrease(self):
+        """Test overload errors halve the limit down to the minimum"""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_concurrency=16, min_concurrency=2, overload_exception=ThrottleError
+        )
+
+        for expected in (8, 4, 2, 2):
+            with pytest.raises(ThrottleError):
+                with limiter:
+                    raise ThrottleError()
+            assert limiter.limit == expected
+
+    def test_other_errors_do_not_decrease(self):
+        """Test non-overload errors count as ordinary completions"""
+        limiter = AdaptiveConcurrencyLimiter(
+            initial_concurrency=4, overload_exception=ThrottleError
+        )
+
+        with pytest.raises(ValueError):
+            with limiter:
+                raise ValueError()
+
+        assert limiter.limit == 4
+
+    def test_blocks_at_limit(self):
+        """Test callers wait while the limit is reached"""
+        limiter = AdaptiveConcurrencyLimiter(initial_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def worker():
+            with limiter:
+                acquired.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not acquired.wait(0.05)
+
+        limiter.release()
+        assert acquired.wait(1)
+        thread.join()
@@ -5,18 +5,18 @@ Tests for utility functions
 
 import csv
 import json
-import os
-import tempfile
-from pathlib import Path
+from datetime import date, datetime
 from unittest.mock import mock_open, patch
 
 import pytest
 
 from yt_info_extract.utils import (
+    _format_calendar_date,
     clean_description,
     create_summary_report,
     export_to_csv,
     export_to_json,
+    export_to_parquet,
     extract_video_stats,
     format_publication_date,
     format_views,
@@ -56,6 +56,7 @@ class TestFormatFunctions:
             ("2005-04-23", "April 23, 2005"),
             ("2020-12-25T15:30:45Z", "December 25, 2020"),
             ("2020-12-25T15:30:45+00:00", "December 25, 2020"),
+            ("2020-12-25 15:30:45", "December 25, 2020"),
         ]
 
         for input_date, expected in test_cases:
@@ -69,12 +70,36 @@ class TestFormatFunctions:
             ("", "Unknown date"),
             ("invalid-date", "invalid-date"),  # Returns original on parse failure
             ("not-a-date-at-all", "not-a-date-at-all"),
+            ("2005-04-23garbage", "2005-04-23garbage"),
+            ("2005-04-23Tgarbage", "2005-04-23Tgarbage"),
+            ("2005-04-23T", "2005-04-23T"),
+            ("2005-04-23 25:00:00", "2005-04-23 25:00:00"),
+            ("2005-13-01", "2005-13-01"),
         ]
 
         for input_date, expected in test_cases:
             result = format_publication_date(input_date)
             assert result == expected, f"Failed for input: {input_date}"
 
+    def test_format_publication_date_non_string(self):
+        """Test non-string publication dates are returned unchanged"""
+        timestamp = datetime(2005, 4, 23)
+
+        assert format_publication_date(1114214400) == 1114214400
+        assert format_publication_date(timestamp) is timestamp
+
+    def test_format_publication_date_same_day_parsed_once(self):
+        """Test dates on the same day reuse one parsed calendar date"""
+        _format_calendar_date.cache_clear()
+        try:
+            with patch("yt_info_extract.utils.date", wraps=date) as mock_date:
+                assert format_publication_date("2005-04-24T03:31:52Z") == "April 24, 2005"
+                assert format_publication_date("2005-04-24T18:00:00Z") == "April 24, 2005"
+        finally:
+            _format_calendar_date.cache_clear()
+
+        mock_date.fromisoformat.assert_called_once_with("2005-04-24")
+
     def test_clean_description(self):
         """Test description cleaning"""
         test_cases = [
@@ -144,45 +169,90 @@ class TestExtractVideoStats:
         assert stats["has_description"] is False
         assert stats["description_length"] == 0
 
+    def test_extract_video_stats_none_description(self):
+        """Test a description explicitly set to None counts as empty"""
+        stats = extract_video_stats({"title": "Test Video", "description": None})
+
+        assert stats["has_description"] is False
+        assert stats["description_length"] == 0
+
 
 class TestExportFunctions:
     """Test export functionality"""
 
-    def test_export_to_json_single_video(self):
+    def test_export_to_json_single_video(self, tmp_path):
         """Test JSON export with single video"""
         video_data = {"title": "Test Video", "channel_name": "Test Channel", "views": 1000000}
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "video.json")
 
-        try:
-            result = export_to_json(video_data, temp_file, pretty=True)
-            assert result is True
+        result = export_to_json(video_data, temp_file, pretty=True)
+        assert result is True
 
-            # Verify file contents
-            with open(temp_file, "r") as f:
-                loaded_data = json.load(f)
-                assert loaded_data == video_data
-        finally:
-            os.unlink(temp_file)
+        # Verify file contents
+        with open(temp_file, "r") as f:
+            loaded_data = json.load(f)
+            assert loaded_data == video_data
 
-    def test_export_to_json_multiple_videos(self):
+    def test_export_to_json_multiple_videos(self, tmp_path):
         """Test JSON export with multiple videos"""
         video_data = [{"title": "Video 1", "views": 1000}, {"title": "Video 2", "views": 2000}]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "video.json")
 
-        try:
-            result = export_to_json(video_data, temp_file, pretty=False)
-            assert result is True
+        result = export_to_json(video_data, temp_file, pretty=False)
+        assert result is True
 
-            # Verify file contents
-            with open(temp_file, "r") as f:
-                loaded_data = json.load(f)
-                assert loaded_data == video_data
-        finally:
-            os.unlink(temp_file)
+        # Verify file contents
+        with open(temp_file, "r") as f:
+            loaded_data = json.load(f)
+            assert loaded_data == video_data
+
+    def test_export_to_json_streamed_matches_json_dump(self, tmp_path, monkeypatch):
+        """Test streamed list output is identical to json.dump in both modes"""
+        monkeypatch.setattr("yt_info_extract.utils.ORJSON_AVAILABLE", False)
+        video_data = [
+            {"title": "Vidéo 1", "tags": ["a", "b"], "description": "Line 1\nLine 2"},
+            {"title": "Video 2", "views": 2000},
+        ]
+        output_file = tmp_path / "videos.json"
+
+        for pretty, options in ((True, {"indent": 2}), (False, {"separators": (",", ":")})):
+            for data in (video_data, []):
+                assert export_to_json(data, str(output_file), pretty=pretty) is True
+                expected = json.dumps(data, ensure_ascii=False, **options)
+                assert output_file.read_text(encoding="utf-8") == expected
+
+    def test_export_to_json_streamed_matches_orjson(self, tmp_path):
+        """Test streamed list output is identical to orjson.dumps in both modes"""
+        orjson = pytest.importorskip("orjson")
+        video_data = [
+            {"title": "Vidéo 1", "tags": ["a", "b"], "description": "Line 1\nLine 2"},
+            {"title": "Video 2", "views": 2000},
+        ]
+        output_file = tmp_path / "videos.json"
+
+        for pretty, option in ((True, orjson.OPT_INDENT_2), (False, 0)):
+            for data in (video_data, video_data[0], []):
+                assert export_to_json(data, str(output_file), pretty=pretty) is True
+                expected = orjson.dumps(data, option=option).decode("utf-8")
+                assert output_file.read_text(encoding="utf-8") == expected
+
+    def test_export_to_json_falls_back_for_unsupported_values(self, tmp_path):
+        """Test values orjson cannot encode are still exported"""
+        output_file = tmp_path / "video.json"
+
+        assert export_to_json({"views": 2**70}, str(output_file)) is True
+        assert json.loads(output_file.read_text()) == {"views": 2**70}
+
+    def test_export_to_json_generator(self, tmp_path):
+        """Test JSON export accepts a generator"""
+        output_file = tmp_path / "videos.json"
+
+        result = export_to_json(({"title": f"Video {i}"} for i in range(3)), str(output_file))
+
+        assert result is True
+        assert json.loads(output_file.read_text()) == [{"title": f"Video {i}"} for i in range(3)]
 
     def test_export_to_json_failure(self):
         """Test JSON export failure handling"""
@@ -192,7 +262,7 @@ class TestExportFunctions:
         result = export_to_json(video_data, invalid_path)
         assert result is False
 
-    def test_export_to_csv_success(self):
+    def test_export_to_csv_success(self, tmp_path):
         """Test CSV export success"""
         video_data = [
             {
@@ -213,32 +283,47 @@ class TestExportFunctions:
             },
         ]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "videos.csv")
 
-        try:
-            result = export_to_csv(video_data, temp_file)
-            assert result is True
-
-            # Verify file contents
-            with open(temp_file, "r", newline="") as f:
-                reader = csv.DictReader(f)
-                rows = list(reader)
-
-                assert len(rows) == 2
-                assert rows[0]["title"] == "Video 1"
-                assert rows[0]["views"] == "1000"
-                assert rows[1]["title"] == "Video 2"
-                # Check that newlines were cleaned
-                assert "\n" not in rows[1]["description"]
-        finally:
-            os.unlink(temp_file)
+        result = export_to_csv(video_data, temp_file)
+        assert result is True
+
+        # Verify file contents
+        with open(temp_file, "r", newline="") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+            assert len(rows) == 2
+            assert rows[0]["title"] == "Video 1"
+            assert rows[0]["views"] == "1000"
+            assert rows[1]["title"] == "Video 2"
+            # Check that newlines were cleaned
+            assert "\n" not in rows[1]["description"]
 
     def test_export_to_csv_empty_data(self):
         """Test CSV export with empty data"""
         result = export_to_csv([], "/tmp/test.csv")
         assert result is False
 
+    @pytest.mark.parametrize("video_data", [None, 42])
+    def test_export_to_csv_invalid_data(self, tmp_path, video_data):
+        """Test CSV export returns False for missing or non-iterable data"""
+        output_file = tmp_path / "videos.csv"
+
+        assert export_to_csv(video_data, str(output_file)) is False
+        assert not output_file.exists()
+
+    def test_export_to_csv_generator(self, tmp_path):
+        """Test CSV export accepts generators, including empty ones"""
+        output_file = tmp_path / "videos.csv"
+
+        result = export_to_csv(({"title": f"Video {i}"} for i in range(3)), str(output_file))
+
+        assert result is True
+        with open(output_file, newline="") as f:
+            assert [row["title"] for row in csv.DictReader(f)] == ["Video 0", "Video 1", "Video 2"]
+        assert export_to_csv((v for v in []), str(output_file)) is False
+
     def test_export_to_csv_failure(self):
         """Test CSV export failure handling"""
         video_data = [{"title": "Test"}]
@@ -248,38 +333,71 @@ class TestExportFunctions:
         assert result is False
 
 
+class TestExportToParquet:
+    """Test Parquet export"""
+
+    def test_export_to_parquet_roundtrip(self, tmp_path):
+        """Test rows from a generator are written with CSV's columns and int64 views"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        output_file = str(tmp_path / "test.parquet")
+        videos = (
+            {"title": f"Video {i}", "views": 1000 * i, "extraction_method": "yt_dlp"}
+            for i in range(3)
+        )
+
+        assert export_to_parquet(videos, output_file) is True
+
+        table = pq.read_table(output_file)
+        assert table.column_names == [
+            "title",
+            "channel_name",
+            "views",
+            "publication_date",
+            "description",
+            "extraction_method",
+        ]
+        assert str(table.schema.field("views").type) == "int64"
+        assert table.column("views").to_pylist() == [0, 1000, 2000]
+        assert table.column("channel_name").to_pylist() == [None, None, None]
+
+    def test_export_to_parquet_empty_data(self, monkeypatch):
+        """Test Parquet export with no rows"""
+        monkeypatch.setattr("yt_info_extract.utils.PYARROW_AVAILABLE", True)
+        assert export_to_parquet([], "test.parquet") is False
+
+    def test_export_to_parquet_without_pyarrow(self, monkeypatch, tmp_path):
+        """Test Parquet export fails cleanly when pyarrow is not installed"""
+        monkeypatch.setattr("yt_info_extract.utils.PYARROW_AVAILABLE", False)
+        output_file = tmp_path / "test.parquet"
+
+        assert export_to_parquet([{"title": "Video"}], str(output_file)) is False
+        assert not output_file.exists()
+
+
 class TestLoadVideoIds:
     """Test video ID loading from file"""
 
-    def test_load_video_ids_success(self):
+    def test_load_video_ids_success(self, tmp_path):
         """Test successful loading of video IDs"""
         video_ids = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
         content = "\n".join(video_ids)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
+        temp_file = tmp_path / "video_ids.txt"
+        temp_file.write_text(content)
 
-        try:
-            result = load_video_ids_from_file(temp_file)
-            assert result == video_ids
-        finally:
-            os.unlink(temp_file)
+        result = load_video_ids_from_file(str(temp_file))
+        assert result == video_ids
 
-    def test_load_video_ids_with_empty_lines(self):
+    def test_load_video_ids_with_empty_lines(self, tmp_path):
         """Test loading video IDs with empty lines"""
         content = "jNQXAC9IVRw\n\ndQw4w9WgXcQ\n\n\nkJQP7kiw5Fk\n"
         expected = ["jNQXAC9IVRw", "dQw4w9WgXcQ", "kJQP7kiw5Fk"]
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-            f.write(content)
-            temp_file = f.name
+        temp_file = tmp_path / "video_ids.txt"
+        temp_file.write_text(content)
 
-        try:
-            result = load_video_ids_from_file(temp_file)
-            assert result == expected
-        finally:
-            os.unlink(temp_file)
+        result = load_video_ids_from_file(str(temp_file))
+        assert result == expected
 
     def test_load_video_ids_file_not_found(self):
         """Test loading video IDs from non-existent file"""
@@ -413,6 +531,25 @@ class TestCreateSummaryReport:
         assert date_range["latest"] == "2007-06-25T00:00:00Z"
         assert date_range["total_videos_with_dates"] == 3
 
+    def test_create_summary_report_unordered_extremes(self):
+        """Test view and date extremes are found when the data is not sorted"""
+        video_data = [
+            {"views": 2000, "publication_date": "2006-05-24T00:00:00Z"},
+            {"views": 3000, "publication_date": "2005-04-23T00:00:00Z"},
+            {"views": 1000, "publication_date": "2007-06-25T00:00:00Z"},
+            {"views": 2500},
+        ]
+
+        report = create_summary_report(video_data)
+
+        assert report["view_statistics"]["max_views"] == 3000
+        assert report["view_statistics"]["min_views"] == 1000
+        assert report["date_range"] == {
+            "earliest": "2005-04-23T00:00:00Z",
+            "latest": "2007-06-25T00:00:00Z",
+            "total_videos_with_dates": 3,
+        }
+
     def test_create_summary_report_with_failures(self):
         """Test summary report with some failures"""
         video_data = [
@@ -453,3 +590,15 @@ class TestCreateSummaryReport:
         assert view_stats["average_views"] == 0
         assert view_stats["max_views"] == 0
         assert view_stats["min_views"] == 0
+
+    def test_create_summary_report_top_channels(self):
+        """Test top channels are the ten most frequent, ties kept in first-seen order"""
+        video_data = [{"channel_name": f"Channel {i}"} for i in range(12)]
+        video_data += [{"channel_name": "Channel 11"}, {"channel_name": "Channel 5"}]
+
+        report = create_summary_report(video_data)
+
+        assert list(report["top_channels"].items()) == [
+            ("Channel 5", 2),
+            ("Channel 11", 2),
+        ] + [(f"Channel {i}", 1) for i in (0, 1, 2, 3, 4, 6, 7, 8)]
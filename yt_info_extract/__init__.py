@@ -31,15 +31,21 @@ __author__ = "Khaldoon Sinjab"
 __email__ = "sinjab@gmail.com"
 __description__ = "YouTube video information extraction with multiple strategies"
 
-from typing import Dict, List, Optional, Union
+import contextlib
+import importlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Union
 
 # Main API exports
-from .extractor import YouTubeVideoInfoExtractor
 from .utils import (
     clean_description,
     create_summary_report,
     export_to_csv,
     export_to_json,
+    export_to_parquet,
     extract_video_stats,
     format_publication_date,
     format_views,
@@ -47,6 +53,110 @@ from .utils import (
     validate_video_info,
 )
 
+if TYPE_CHECKING:
+    from .cache import MemoryVideoInfoCache, VideoInfoCache
+    from .extractor import YouTubeVideoInfoExtractor
+
+# The extractor and caches are imported on first access (PEP 562), so code that only
+# needs the formatting and export helpers does not pay for loading them
+_LAZY_EXPORTS = {
+    "YouTubeVideoInfoExtractor": ".extractor",
+    "VideoInfoCache": ".cache",
+    "MemoryVideoInfoCache": ".cache",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+# Extractors shared by the convenience functions, least recently used first, and the number
+# of calls currently using each one. Evicted extractors are closed once no call uses them.
+_SHARED_EXTRACTORS_MAXSIZE = 8
+_shared_extractors: "OrderedDict[tuple, YouTubeVideoInfoExtractor]" = OrderedDict()
+_shared_extractor_users: "Dict[YouTubeVideoInfoExtractor, int]" = {}
+_shared_extractors_lock = threading.Lock()
+
+
+def _acquire_extractor(key: tuple, extractor_class, options: Dict) -> "YouTubeVideoInfoExtractor":
+    evicted = None
+    with _shared_extractors_lock:
+        extractor = _shared_extractors.get(key)
+        if extractor is not None:
+            _shared_extractors.move_to_end(key)
+        else:
+            extractor = extractor_class(**options)
+            _shared_extractors[key] = extractor
+            if len(_shared_extractors) > _SHARED_EXTRACTORS_MAXSIZE:
+                _, evicted = _shared_extractors.popitem(last=False)
+                if evicted in _shared_extractor_users:
+                    # Still in use; the last call using it closes it (see _release_extractor)
+                    evicted = None
+        _shared_extractor_users[extractor] = _shared_extractor_users.get(extractor, 0) + 1
+
+    if evicted is not None:
+        evicted.close()
+    return extractor
+
+
+def _release_extractor(extractor: "YouTubeVideoInfoExtractor") -> None:
+    with _shared_extractors_lock:
+        users = _shared_extractor_users.pop(extractor) - 1
+        if users:
+            _shared_extractor_users[extractor] = users
+            return
+        if any(cached is extractor for cached in _shared_extractors.values()):
+            return
+    extractor.close()
+
+
+@contextlib.contextmanager
+def _shared_extractor(**options) -> "Iterator[YouTubeVideoInfoExtractor]":
+    """
+    Provide an extractor for the convenience functions, reused across calls.
+
+    Calls with the same options (and the same YOUTUBE_API_KEY and YT_INFO_CACHE environment
+    variables, which the extractor reads when it is built) share one extractor, so repeated
+    get_video_info() calls keep its API and yt-dlp connections open instead of rebuilding
+    them every time. The extractor is safe to share between threads.
+
+    Args:
+        **options: YouTubeVideoInfoExtractor keyword arguments
+
+    Yields:
+        Extractor configured with the given options
+    """
+    # Looked up on the package so the lazy import (and any patched class) applies
+    extractor_class = sys.modules[__name__].YouTubeVideoInfoExtractor
+    key = (
+        extractor_class,
+        tuple(sorted(options.items())),
+        os.environ.get("YOUTUBE_API_KEY"),
+        os.environ.get("YT_INFO_CACHE"),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable option values cannot be cached, so they get a private extractor
+        extractor = extractor_class(**options)
+        try:
+            yield extractor
+        finally:
+            extractor.close()
+        return
+
+    extractor = _acquire_extractor(key, extractor_class, options)
+    try:
+        yield extractor
+    finally:
+        _release_extractor(extractor)
+
 
 # Convenience functions for common use cases
 def get_video_info(
@@ -72,8 +182,8 @@ def get_video_info(
         info = get_video_info("jNQXAC9IVRw", api_key="YOUR_KEY")
         info = get_video_info("jNQXAC9IVRw", strategy="yt_dlp")
     """
-    extractor = YouTubeVideoInfoExtractor(api_key=api_key, strategy=strategy, **extractor_options)
-    return extractor.get_video_info(video_input)
+    with _shared_extractor(api_key=api_key, strategy=strategy, **extractor_options) as extractor:
+        return extractor.get_video_info(video_input)
 
 
 def get_video_info_batch(
@@ -81,6 +191,7 @@ def get_video_info_batch(
     api_key: Optional[str] = None,
     strategy: str = "auto",
     delay_between_requests: float = 0.5,
+    concurrency: int = 1,
     **extractor_options,
 ) -> List[Dict]:
     """
@@ -91,6 +202,7 @@ def get_video_info_batch(
         api_key: YouTube Data API v3 key (optional, gets from env if not provided)
         strategy: Extraction strategy ("auto", "api", "yt_dlp", "pytubefix")
         delay_between_requests: Delay between requests to avoid rate limiting
+        concurrency: Maximum yt-dlp/pytubefix lookups in flight at once
         **extractor_options: Additional options for the extractor
 
     Returns:
@@ -100,9 +212,12 @@ def get_video_info_batch(
         videos = ["jNQXAC9IVRw", "dQw4w9WgXcQ"]
         results = get_video_info_batch(videos)
         results = get_video_info_batch(videos, api_key="YOUR_KEY", strategy="api")
+        results = get_video_info_batch(videos, strategy="yt_dlp", concurrency=4)
     """
-    extractor = YouTubeVideoInfoExtractor(api_key=api_key, strategy=strategy, **extractor_options)
-    return extractor.batch_extract(video_inputs, strategy, delay_between_requests)
+    with _shared_extractor(api_key=api_key, strategy=strategy, **extractor_options) as extractor:
+        return extractor.batch_extract(
+            video_inputs, strategy, delay_between_requests, concurrency=concurrency
+        )
 
 
 def get_video_stats(
@@ -135,16 +250,16 @@ def get_video_stats(
 
 
 def export_video_info(
-    video_data: Union[Dict, List[Dict]], output_file: str, format_type: str = "json", **kwargs
+    video_data: Union[Dict, Iterable[Dict]], output_file: str, format_type: str = "json", **kwargs
 ) -> bool:
     """
     Quick function to export video information to file.
 
     Args:
-        video_data: Single video info dict or list of video info dicts
+        video_data: Single video info dict or an iterable (list, generator) of dicts
         output_file: Path to output file
-        format_type: Export format ("json" or "csv")
-        **kwargs: Additional export options
+        format_type: Export format ("json", "csv" or "parquet")
+        **kwargs: Additional export options (pretty=True indents JSON; compact by default)
 
     Returns:
         True if successful, False otherwise
@@ -157,14 +272,18 @@ def export_video_info(
         export_video_info(batch_results, "videos.csv", format_type="csv")
     """
     if format_type.lower() == "json":
-        pretty = kwargs.get("pretty", True)
+        pretty = kwargs.get("pretty", False)
         return export_to_json(video_data, output_file, pretty)
     elif format_type.lower() == "csv":
         if isinstance(video_data, dict):
             video_data = [video_data]
         return export_to_csv(video_data, output_file)
+    elif format_type.lower() == "parquet":
+        if isinstance(video_data, dict):
+            video_data = [video_data]
+        return export_to_parquet(video_data, output_file)
     else:
-        raise ValueError("format_type must be 'json' or 'csv'")
+        raise ValueError("format_type must be 'json', 'csv' or 'parquet'")
 
 
 def test_extraction_methods() -> Dict[str, bool]:
@@ -178,22 +297,26 @@ def test_extraction_methods() -> Dict[str, bool]:
         methods = test_extraction_methods()
         print("Available methods:", [k for k, v in methods.items() if v])
     """
-    extractor = YouTubeVideoInfoExtractor()
+    with _shared_extractor() as extractor:
+        available = extractor.get_available_strategies()
 
-    return {
-        "youtube_api": extractor.youtube_service is not None,
-        "yt_dlp": "yt_dlp" in extractor.get_available_strategies(),
-        "pytubefix": "pytubefix" in extractor.get_available_strategies(),
-    }
+        return {
+            "youtube_api": extractor.youtube_service is not None,
+            "yt_dlp": "yt_dlp" in available,
+            "pytubefix": "pytubefix" in available,
+        }
 
 
 # Module metadata
 __all__ = [
     # Main class
     "YouTubeVideoInfoExtractor",
+    "VideoInfoCache",
+    "MemoryVideoInfoCache",
     # Utility functions
     "export_to_json",
     "export_to_csv",
+    "export_to_parquet",
     "load_video_ids_from_file",
     "format_views",
     "format_publication_date",
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk cache for extracted video information
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Default time-to-live in seconds per extraction method. Scraped results are kept longer
+# because yt-dlp and pytubefix are the strategies most sensitive to rate limiting.
+DEFAULT_TTLS = {
+    "youtube_api": 24 * 60 * 60,
+    "yt_dlp": 48 * 60 * 60,
+    "pytubefix": 48 * 60 * 60,
+}
+DEFAULT_TTL = 24 * 60 * 60
+
+
+def _ttl_for(extraction_method: Optional[str], ttl: Optional[float]) -> float:
+    if ttl is not None:
+        return ttl
+    return DEFAULT_TTLS.get(extraction_method, DEFAULT_TTL)
+
+
+def _dumps(video_info: Dict) -> str:
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(video_info).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. integers wider than 64 bits)
+            pass
+    return json.dumps(video_info, ensure_ascii=False)
+
+
+class VideoInfoCache:
+    """
+    SQLite-backed cache of video information keyed by video ID and strategy.
+
+    Entries expire after a TTL that depends on the extraction method that produced them
+    (see DEFAULT_TTLS), unless an explicit ttl is given.
+
+    Example:
+        cache = VideoInfoCache("~/.cache/yt_info_extract/videos.sqlite")
+        cache.set("jNQXAC9IVRw", "auto", info)
+        info = cache.get("jNQXAC9IVRw", "auto")
+    """
+
+    def __init__(self, path: str, ttl: Optional[float] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file ("~" is expanded)
+            ttl: Time-to-live in seconds for every entry (default: per extraction method)
+        """
+        self.path = os.path.expanduser(path)
+        self.ttl = ttl
+
+        parent = os.path.dirname(self.path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS video_info ("
+            "video_id TEXT NOT NULL, "
+            "strategy TEXT NOT NULL, "
+            "extraction_method TEXT, "
+            "data TEXT NOT NULL, "
+            "fetched_at REAL NOT NULL, "
+            "PRIMARY KEY (video_id, strategy))"
+        )
+        self._conn.commit()
+
+    def get(self, video_id: str, strategy: str) -> Optional[Dict]:
+        """
+        Look up cached video information.
+
+        Args:
+            video_id: YouTube video ID
+            strategy: Strategy the information was requested with
+
+        Returns:
+            Cached video information, or None if missing or expired
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT extraction_method, data, fetched_at FROM video_info "
+                    "WHERE video_id = ? AND strategy = ?",
+                    (video_id, strategy),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache lookup failed for {video_id}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        extraction_method, data, fetched_at = row
+        if time.time() - fetched_at >= _ttl_for(extraction_method, self.ttl):
+            return None
+
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+    def set(self, video_id: str, strategy: str, video_info: Dict) -> None:
+        """
+        Store video information.
+
+        Args:
+            video_id: YouTube video ID
+            strategy: Strategy the information was requested with
+            video_info: Video information dictionary
+        """
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO video_info VALUES (?, ?, ?, ?, ?)",
+                    (
+                        video_id,
+                        strategy,
+                        video_info.get("extraction_method"),
+                        _dumps(video_info),
+                        time.time(),
+                    ),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Cache write failed for {video_id}: {e}")
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM video_info")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class MemoryVideoInfoCache:
+    """
+    In-process LRU cache of video information with the same interface as VideoInfoCache.
+
+    Holds at most maxsize entries, evicting the least recently used one first. Entries
+    expire after the same per-extraction-method TTLs as the on-disk cache.
+
+    Example:
+        cache = MemoryVideoInfoCache(maxsize=1024)
+        cache.set("jNQXAC9IVRw", "auto", info)
+        info = cache.get("jNQXAC9IVRw", "auto")
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Time-to-live in seconds for every entry (default: per extraction method)
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, video_id: str, strategy: str) -> Optional[Dict]:
+        """
+        Look up cached video information.
+
+        Args:
+            video_id: YouTube video ID
+            strategy: Strategy the information was requested with
+
+        Returns:
+            Copy of the cached video information, or None if missing or expired
+        """
+        key = (video_id, strategy)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, video_info = entry
+            if time.time() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        return dict(video_info)
+
+    def set(self, video_id: str, strategy: str, video_info: Dict) -> None:
+        """
+        Store video information.
+
+        Args:
+            video_id: YouTube video ID
+            strategy: Strategy the information was requested with
+            video_info: Video information dictionary
+        """
+        expires_at = time.time() + _ttl_for(video_info.get("extraction_method"), self.ttl)
+        key = (video_id, strategy)
+        with self._lock:
+            self._entries[key] = (expires_at, dict(video_info))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Release the cached entries."""
+        self.clear()
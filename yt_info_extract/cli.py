@@ -7,14 +7,17 @@ CLI for extracting video metadata with various output formats and strategies.
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .extractor import YouTubeVideoInfoExtractor
 from .utils import (
+    _json_encode,
     clean_description,
     create_summary_report,
     export_to_csv,
     export_to_json,
+    export_to_parquet,
     extract_video_stats,
     format_publication_date,
     format_views,
@@ -24,25 +27,29 @@ from .utils import (
 
 def print_video_info(video_info, format_type="text"):
     """Print video information in specified format"""
+    # Lines are collected and written with a single print call
     if not video_info or video_info.get("error"):
-        print(f"❌ Failed to extract video information")
+        lines = ["❌ Failed to extract video information"]
         if video_info and video_info.get("error"):
-            print(f"   Error: {video_info['error']}")
+            lines.append(f"   Error: {video_info['error']}")
+        print("\n".join(lines))
         return
 
     if format_type == "text":
-        print(f"📹 Title: {video_info.get('title', 'N/A')}")
-        print(f"📺 Channel: {video_info.get('channel_name', 'N/A')}")
-        print(f"👀 Views: {format_views(video_info.get('views'))}")
-        print(f"📅 Published: {format_publication_date(video_info.get('publication_date'))}")
-        print(f"🔧 Method: {video_info.get('extraction_method', 'N/A')}")
+        lines = [
+            f"📹 Title: {video_info.get('title', 'N/A')}",
+            f"📺 Channel: {video_info.get('channel_name', 'N/A')}",
+            f"👀 Views: {format_views(video_info.get('views'))}",
+            f"📅 Published: {format_publication_date(video_info.get('publication_date'))}",
+            f"🔧 Method: {video_info.get('extraction_method', 'N/A')}",
+        ]
 
         description = video_info.get("description")
         if description:
             cleaned_desc = clean_description(description, 200)
-            print(f"📝 Description: {cleaned_desc}")
+            lines.append(f"📝 Description: {cleaned_desc}")
         else:
-            print("📝 Description: Not available")
+            lines.append("📝 Description: Not available")
 
     elif format_type == "compact":
         title = (
@@ -53,18 +60,25 @@ def print_video_info(video_info, format_type="text"):
         channel = video_info.get("channel_name", "N/A")
         views = format_views(video_info.get("views"))
         method = video_info.get("extraction_method", "N/A")
-        print(f"{title} | {channel} | {views} | {method}")
+        lines = [f"{title} | {channel} | {views} | {method}"]
 
     elif format_type == "stats":
         stats = extract_video_stats(video_info)
-        print("Video Statistics:")
-        print(f"  Title: {stats['title']}")
-        print(f"  Channel: {stats['channel']}")
-        print(f"  Views: {stats['formatted_views']} ({stats['raw_views']:,})")
-        print(f"  Published: {stats['formatted_date']}")
-        print(f"  Description Length: {stats['description_length']} characters")
-        print(f"  Has Description: {'Yes' if stats['has_description'] else 'No'}")
-        print(f"  Extraction Method: {stats['extraction_method']}")
+        lines = [
+            "Video Statistics:",
+            f"  Title: {stats['title']}",
+            f"  Channel: {stats['channel']}",
+            f"  Views: {stats['formatted_views']} ({stats['raw_views']:,})",
+            f"  Published: {stats['formatted_date']}",
+            f"  Description Length: {stats['description_length']} characters",
+            f"  Has Description: {'Yes' if stats['has_description'] else 'No'}",
+            f"  Extraction Method: {stats['extraction_method']}",
+        ]
+
+    else:
+        return
+
+    print("\n".join(lines))
 
 
 def main():
@@ -111,12 +125,14 @@ Examples:
     parser.add_argument(
         "-f",
         "--format",
-        choices=["text", "compact", "stats", "json", "csv"],
+        choices=["text", "compact", "stats", "json", "csv", "parquet"],
         default="text",
         help="Output format (default: text)",
     )
 
-    parser.add_argument("-o", "--output", help="Output file path (required for json/csv formats)")
+    parser.add_argument(
+        "-o", "--output", help="Output file path (required for json/csv/parquet formats)"
+    )
 
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output")
 
@@ -132,6 +148,20 @@ Examples:
         help="Delay between requests in batch mode (seconds, default: 0.5)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Maximum yt-dlp/pytubefix lookups in flight in batch mode (default: 1)",
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write batch results to batch_results.jsonl in --output-dir as they complete, "
+        "resuming an interrupted run (no summary or sample output)",
+    )
+
     # Testing and info options
     parser.add_argument("--test-api", action="store_true", help="Test API key validity and exit")
 
@@ -198,9 +228,12 @@ Examples:
     if not args.batch and not args.video_input:
         parser.error("Either provide a video_input or use --batch option")
 
-    if args.format in ["json", "csv"] and not args.output and not args.batch:
+    if args.format in ["json", "csv", "parquet"] and not args.output and not args.batch:
         parser.error(f"--output is required for {args.format} format")
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
     # Single video processing
     if args.video_input:
         print(f"🔍 Extracting information for: {args.video_input}")
@@ -220,15 +253,11 @@ Examples:
                 else:
                     return 1
             else:
-                import json
-
-                if args.pretty:
-                    print(json.dumps(video_info, ensure_ascii=False, indent=2))
-                else:
-                    print(json.dumps(video_info, ensure_ascii=False))
+                print(_json_encode(video_info, args.pretty).decode("utf-8"))
 
-        elif args.format == "csv":
-            success = export_to_csv([video_info], args.output)
+        elif args.format in ("csv", "parquet"):
+            export = export_to_csv if args.format == "csv" else export_to_parquet
+            success = export([video_info], args.output)
             if success:
                 print(f"✅ Exported to {args.output}")
             else:
@@ -246,9 +275,27 @@ Examples:
             print("❌ No video IDs loaded")
             return 1
 
+        if args.stream:
+            if not args.output_dir:
+                print("❌ --stream requires --output-dir")
+                return 1
+
+            output_dir = Path(args.output_dir)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            output_file = output_dir / "batch_results.jsonl"
+
+            print(f"🔄 Streaming {len(video_ids)} videos to {output_file}...")
+            extractor.batch_extract_stream(
+                video_ids, str(output_file), args.strategy, args.delay, concurrency=args.concurrency
+            )
+            print(f"✅ Batch results saved to {output_file}")
+            return 0
+
         print(f"🔄 Processing {len(video_ids)} videos...")
 
-        results = extractor.batch_extract(video_ids, args.strategy, args.delay)
+        results = extractor.batch_extract(
+            video_ids, args.strategy, args.delay, concurrency=args.concurrency
+        )
 
         # Handle batch output
         if args.output_dir:
@@ -262,12 +309,21 @@ Examples:
             elif args.format == "csv":
                 output_file = output_dir / "batch_results.csv"
                 export_to_csv(results, str(output_file))
+            elif args.format == "parquet":
+                output_file = output_dir / "batch_results.parquet"
+                export_to_parquet(results, str(output_file))
             else:
-                # Export as both for convenience
+                # Export as both for convenience; the two files are independent, so write
+                # them concurrently
                 json_file = output_dir / "batch_results.json"
                 csv_file = output_dir / "batch_results.csv"
-                export_to_json(results, str(json_file), True)
-                export_to_csv(results, str(csv_file))
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    exports = [
+                        executor.submit(export_to_json, results, str(json_file), True),
+                        executor.submit(export_to_csv, results, str(csv_file)),
+                    ]
+                    for export in exports:
+                        export.result()
 
             print(f"✅ Batch results saved to {output_dir}")
 
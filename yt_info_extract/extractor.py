@@ -4,40 +4,144 @@ YouTube Video Information Extractor
 Multi-strategy implementation with YouTube Data API v3 as primary and fallback methods
 """
 
+import contextlib
+import functools
+import hashlib
+import importlib.util
 import json
 import logging
 import os
+import random
+import re
+import string
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
 
-# Import for different extraction strategies
-try:
-    from googleapiclient.discovery import build
-    from googleapiclient.errors import HttpError
-
-    GOOGLE_API_AVAILABLE = True
-except ImportError:
-    GOOGLE_API_AVAILABLE = False
-
-try:
-    import yt_dlp
+from .cache import MemoryVideoInfoCache, VideoInfoCache
+from .ratelimit import AdaptiveConcurrencyLimiter, TokenBucket
+from .utils import _json_encode
 
-    YT_DLP_AVAILABLE = True
-except ImportError:
-    YT_DLP_AVAILABLE = False
+# The extraction libraries take hundreds of milliseconds to import, so only check that they
+# are installed here and import them on first use in the methods that need them
+GOOGLE_API_AVAILABLE = importlib.util.find_spec("googleapiclient") is not None
+YT_DLP_AVAILABLE = importlib.util.find_spec("yt_dlp") is not None
+PYTUBEFIX_AVAILABLE = importlib.util.find_spec("pytubefix") is not None
 
 try:
-    from pytubefix import YouTube
+    import orjson
 
-    PYTUBEFIX_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PYTUBEFIX_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Maximum number of comma-separated IDs accepted by a single videos.list request
+API_BATCH_SIZE = 50
+
+# Response fields read by _parse_api_item; the API omits everything else from the reply
+_API_VIDEO_FIELDS = (
+    "items(id,snippet(title,description,channelTitle,publishedAt),statistics/viewCount)"
+)
+
+# Maximum number of videos.list chunk requests in flight at once
+API_MAX_WORKERS = 8
+
+# Upper bound in seconds for a single retry backoff delay
+MAX_BACKOFF_DELAY = 30.0
+
+# Seconds the auto strategy skips the API after the daily quota is reported exhausted
+API_QUOTA_COOLDOWN = 60 * 60
+
+# YouTube video IDs are exactly 11 characters: alphanumeric, underscore, and hyphen
+_VIDEO_ID_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
+# Error messages YouTube scrapers see when they are throttled or soft-blocked
+_THROTTLE_RE = re.compile(r"HTTP Error (?:403|429)|Too Many Requests")
+
+
+class YouTubeThrottleError(Exception):
+    """Raised when YouTube rejects a scraping request with HTTP 429 or 403."""
+
+
+class PermanentExtractionError(Exception):
+    """Raised when an extraction fails in a way retrying cannot fix (e.g. a deleted video)."""
+
+
+def _is_throttle_error(error: Exception) -> bool:
+    return getattr(error, "code", None) in (403, 429) or bool(_THROTTLE_RE.search(str(error)))
+
+
+def _is_retryable_http_error(error: Exception) -> bool:
+    """Whether an API HTTP error is transient (throttling or a server-side failure)."""
+    status = int(getattr(getattr(error, "resp", None), "status", 0) or 0)
+    if status == 429 or status >= 500:
+        return True
+    # 403 also covers per-user rate limits, which clear up; quota and key errors do not
+    content = getattr(error, "content", b"") or b""
+    return status == 403 and (b"rateLimitExceeded" in content or b"RateLimitExceeded" in content)
+
+
+def _is_quota_error(error: Exception) -> bool:
+    """Whether an API HTTP error reports the project's daily quota as exhausted."""
+    status = int(getattr(getattr(error, "resp", None), "status", 0) or 0)
+    content = getattr(error, "content", b"") or b""
+    return status == 403 and (b"quotaExceeded" in content or b"dailyLimitExceeded" in content)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds an HTTP error's Retry-After header asks us to wait, if it gives a number."""
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if resp is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=None)
+def _api_model():
+    """
+    Return the googleapiclient model used to parse API responses.
+
+    Returns:
+        A JsonModel that decodes with orjson, or None (googleapiclient's stdlib-json
+        default) when orjson is not installed
+    """
+    if not ORJSON_AVAILABLE:
+        return None
+
+    from googleapiclient.model import JsonModel
+
+    class _OrjsonModel(JsonModel):
+        """googleapiclient JsonModel that parses API responses with orjson."""
+
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Non-JSON bodies (e.g. HTML error pages) keep the stock behaviour
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and "data" in body:
+                body = body["data"]
+            return body
+
+    return _OrjsonModel()
+
+
+# Caps concurrent yt-dlp/pytubefix requests and backs off when YouTube throttles. It is
+# shared by every extractor in the process because YouTube throttles per client IP.
+_SCRAPE_LIMITER = AdaptiveConcurrencyLimiter(
+    initial_concurrency=2,
+    min_concurrency=1,
+    max_concurrency=32,
+    overload_exception=YouTubeThrottleError,
+)
+
 
 class YouTubeVideoInfoExtractor:
     """
@@ -63,6 +167,13 @@ class YouTubeVideoInfoExtractor:
         info = extractor.get_video_info("jNQXAC9IVRw")
     """
 
+    # Extraction method name per strategy, and whether it scrapes YouTube directly
+    _STRATEGY_METHODS = {
+        "api": ("_get_video_info_api", False),
+        "yt_dlp": ("_get_video_info_yt_dlp", True),
+        "pytubefix": ("_get_video_info_pytubefix", True),
+    }
+
     def __init__(
         self,
         *,
@@ -70,8 +181,11 @@ class YouTubeVideoInfoExtractor:
         strategy: str = "auto",  # "api", "yt_dlp", "pytubefix", "auto"
         timeout: float = 30,
         max_retries: int = 3,
-        backoff_factor: float = 0.75,
+        backoff_factor: float = 2.0,
         rate_limit_delay: float = 0.1,
+        cache_path: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        memory_cache_size: int = 0,
     ):
         """
         Initialize the YouTube video info extractor.
@@ -81,26 +195,50 @@ class YouTubeVideoInfoExtractor:
             strategy: Extraction strategy ("auto", "api", "yt_dlp", "pytubefix")
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
-            backoff_factor: Exponential backoff factor for retries
-            rate_limit_delay: Delay between requests to avoid rate limiting
+            backoff_factor: Exponential backoff factor for retries; the delay before retry n
+                is drawn up to backoff_factor**n seconds, capped at MAX_BACKOFF_DELAY
+            rate_limit_delay: Minimum average delay between requests to avoid rate limiting
+            cache_path: Path to an on-disk cache of extracted info (gets from the
+                YT_INFO_CACHE environment variable if not provided; disabled if neither is set)
+            cache_ttl: Cache time-to-live in seconds (default: 24h for API, 48h for scraping)
+            memory_cache_size: Number of results to keep in an in-process LRU cache when
+                no on-disk cache is configured (default: 0, disabled)
         """
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.rate_limit_delay = rate_limit_delay
+        # Paces get_video_info calls; time already spent on a request counts towards the delay
+        self._rate_limiter = TokenBucket(1 / rate_limit_delay) if rate_limit_delay > 0 else None
         self.strategy = strategy.lower()
+        self._local = threading.local()
+        # Monotonic time until which the API is skipped after its quota ran out
+        self._api_disabled_until = 0.0
+
+        # Per-thread yt-dlp clients and API connections by thread ident; pool workers' clients
+        # are closed when their pool shuts down (see _worker_pool), the rest by close()
+        self._clients = {}
+        self._clients_lock = threading.Lock()
+
+        # Set up the result cache
+        cache_path = cache_path or os.environ.get("YT_INFO_CACHE")
+        if cache_path:
+            self.cache = VideoInfoCache(cache_path, cache_ttl)
+        elif memory_cache_size > 0:
+            self.cache = MemoryVideoInfoCache(memory_cache_size, cache_ttl)
+        else:
+            self.cache = None
 
         # Set up API key
         self.api_key = api_key or os.environ.get("YOUTUBE_API_KEY")
 
-        # Initialize YouTube API service if available and API key provided
-        self.youtube_service = None
-        if GOOGLE_API_AVAILABLE and self.api_key:
-            try:
-                self.youtube_service = build("youtube", "v3", developerKey=self.api_key)
-                logger.info("YouTube Data API v3 service initialized successfully")
-            except Exception as e:
-                logger.warning(f"Failed to initialize YouTube API service: {e}")
+        # The YouTube API service is built on first use (see youtube_service), so extractors
+        # that never reach the API strategy do not pay for client setup
+        self._youtube_service = None
+        self._youtube_service_ready = False
+        self._youtube_service_lock = threading.Lock()
+        # Thread allowed to use the service's own httplib2 connection (see _api_http)
+        self._youtube_service_thread = None
 
         # Validate strategy
         valid_strategies = ["auto", "api", "yt_dlp", "pytubefix"]
@@ -114,6 +252,86 @@ class YouTubeVideoInfoExtractor:
         if self.strategy == "pytubefix" and not PYTUBEFIX_AVAILABLE:
             raise ImportError("pytubefix is not installed. Install with: pip install pytubefix")
 
+        # Availability only changes with installed packages and the API key, so resolve the
+        # auto strategy order (API -> yt-dlp -> pytubefix) once instead of on every call
+        self._available_strategies = tuple(
+            name
+            for name, available in (
+                ("api", GOOGLE_API_AVAILABLE and bool(self.api_key)),
+                ("yt_dlp", YT_DLP_AVAILABLE),
+                ("pytubefix", PYTUBEFIX_AVAILABLE),
+            )
+            if available
+        )
+
+    @property
+    def youtube_service(self):
+        """YouTube Data API v3 service, built on first access (None if unavailable)."""
+        if not self._youtube_service_ready:
+            with self._youtube_service_lock:
+                if not self._youtube_service_ready:
+                    if GOOGLE_API_AVAILABLE and self.api_key:
+                        try:
+                            from googleapiclient.discovery import build
+
+                            self._youtube_service = build(
+                                "youtube", "v3", developerKey=self.api_key, model=_api_model()
+                            )
+                            self._youtube_service_thread = threading.get_ident()
+                            logger.info("YouTube Data API v3 service initialized successfully")
+                        except Exception as e:
+                            logger.warning(f"Failed to initialize YouTube API service: {e}")
+                    self._youtube_service_ready = True
+        return self._youtube_service
+
+    @youtube_service.setter
+    def youtube_service(self, service) -> None:
+        with self._youtube_service_lock:
+            self._youtube_service = service
+            self._youtube_service_ready = True
+            self._youtube_service_thread = threading.get_ident()
+
+    def close(self) -> None:
+        """Close the API, yt-dlp and cache connections held by this extractor."""
+        with self._clients_lock:
+            clients, self._clients = self._clients, {}
+        for thread_clients in clients.values():
+            for client in thread_clients:
+                client.close()
+        self._local = threading.local()
+
+        with self._youtube_service_lock:
+            service, self._youtube_service = self._youtube_service, None
+            self._youtube_service_ready = False
+            self._youtube_service_thread = None
+        if service is not None and hasattr(service, "close"):
+            service.close()
+
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    def __enter__(self) -> "YouTubeVideoInfoExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Delay before retrying after a failed attempt.
+
+        Uses "full jitter": a random delay up to the exponential backoff bound, so
+        concurrent callers that fail together do not all retry at the same moment.
+
+        Args:
+            attempt: Zero-based index of the attempt that failed
+
+        Returns:
+            Delay in seconds
+        """
+        return random.uniform(0, min(MAX_BACKOFF_DELAY, self.backoff_factor**attempt))
+
     def _validate_video_id(self, video_id: str) -> Optional[str]:
         """
         Validate YouTube video ID format.
@@ -124,10 +342,8 @@ class YouTubeVideoInfoExtractor:
         Returns:
             Video ID if valid, None if invalid
         """
-        import re
-
-        # YouTube video IDs are exactly 11 characters and contain only alphanumeric, underscore, and hyphen
-        if len(video_id) == 11 and re.match(r"^[A-Za-z0-9_-]{11}$", video_id):
+        # A length check and a set lookup, no regex engine needed for a fixed alphabet
+        if len(video_id) == 11 and _VIDEO_ID_CHARS.issuperset(video_id):
             return video_id
 
         logger.error(
@@ -143,46 +359,247 @@ class YouTubeVideoInfoExtractor:
             video_id: YouTube video ID
 
         Returns:
-            Video information dictionary or None on failure
+            Video information dictionary or None on a transient failure
+
+        Raises:
+            PermanentExtractionError: If the video does not exist or the request is rejected
+                in a way that retrying cannot fix
         """
         if not self.youtube_service:
-            logger.error("YouTube API service not available")
-            return None
+            raise PermanentExtractionError("YouTube API service not available")
+
+        from googleapiclient.errors import HttpError
 
         try:
             # Construct the request
-            request = self.youtube_service.videos().list(part="snippet,statistics", id=video_id)
+            request = self.youtube_service.videos().list(
+                part="snippet,statistics", id=video_id, fields=_API_VIDEO_FIELDS
+            )
 
             # Execute the request
-            response = request.execute()
+            response = request.execute(http=self._api_http())
 
             if not response.get("items"):
-                logger.error(f"No video found with ID: {video_id}")
-                return None
+                raise PermanentExtractionError(f"No video found with ID: {video_id}")
 
             # Parse the response
-            video_item = response["items"][0]
-            snippet = video_item.get("snippet", {})
-            statistics = video_item.get("statistics", {})
-
-            return {
-                "title": snippet.get("title"),
-                "description": snippet.get("description"),
-                "channel_name": snippet.get("channelTitle"),
-                "publication_date": snippet.get("publishedAt"),
-                "views": (
-                    int(statistics.get("viewCount", 0)) if statistics.get("viewCount") else None
-                ),
-                "extraction_method": "youtube_api",
-            }
+            return self._parse_api_item(response["items"][0])
 
         except HttpError as e:
             logger.error(f"YouTube API HTTP error {e.resp.status}: {e.content}")
+            self._note_api_error(e)
+            if not _is_retryable_http_error(e):
+                # Bad requests, missing videos, invalid keys and exhausted quota fail again
+                raise PermanentExtractionError(str(e)) from e
             return None
+        except PermanentExtractionError:
+            raise
         except Exception as e:
             logger.error(f"YouTube API unexpected error: {e}")
             return None
 
+    def _get_video_info_api_batch(
+        self, video_ids: List[str], delay_between_chunks: float = 0.0, burst: int = 1
+    ) -> Dict[str, Dict]:
+        """
+        Extract video information for many videos using batched videos.list requests.
+
+        IDs are sent in chunks of up to API_BATCH_SIZE, so each chunk costs a single
+        HTTP round trip and a single quota unit. When there is more than one chunk, up to
+        API_MAX_WORKERS chunks are fetched concurrently.
+
+        Args:
+            video_ids: List of validated YouTube video IDs
+            delay_between_chunks: Average delay between consecutive chunk requests
+            burst: Number of chunk requests allowed back-to-back before pacing starts
+
+        Returns:
+            Dictionary mapping video ID to video information; IDs that were not found
+            or whose chunk failed are omitted
+        """
+        if not self.youtube_service:
+            logger.error("YouTube API service not available")
+            return {}
+
+        chunks = [
+            video_ids[start : start + API_BATCH_SIZE]
+            for start in range(0, len(video_ids), API_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._fetch_api_chunk(chunks[0])
+
+        limiter = TokenBucket(1 / delay_between_chunks, burst) if delay_between_chunks > 0 else None
+        results = {}
+
+        # Chunks are independent, so overlap their round trips. Pacing is applied here
+        # rather than in the workers so request start times stay evenly spaced.
+        with self._worker_pool(min(API_MAX_WORKERS, len(chunks))) as executor:
+            futures = []
+            for chunk in chunks:
+                if limiter:
+                    limiter.acquire()
+                futures.append(executor.submit(self._fetch_api_chunk, chunk))
+
+            for future in futures:
+                results.update(future.result())
+
+        return results
+
+    def _fetch_api_chunk(self, chunk: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch one chunk of videos with a single videos.list request, retrying on failure.
+
+        Args:
+            chunk: Up to API_BATCH_SIZE validated YouTube video IDs
+
+        Returns:
+            Dictionary mapping video ID to video information
+        """
+        from googleapiclient.errors import HttpError
+
+        http = self._api_http()
+
+        for attempt in range(self.max_retries):
+            if self._api_quota_exhausted():
+                break
+
+            retry_after = None
+            try:
+                request = self.youtube_service.videos().list(
+                    part="snippet,statistics", id=",".join(chunk), fields=_API_VIDEO_FIELDS
+                )
+                response = request.execute(http=http)
+
+                return {
+                    video_item["id"]: self._parse_api_item(video_item)
+                    for video_item in response.get("items", [])
+                }
+
+            except HttpError as e:
+                logger.error(f"YouTube API HTTP error {e.resp.status}: {e.content}")
+                self._note_api_error(e)
+                if not _is_retryable_http_error(e):
+                    # Bad requests, invalid keys and exhausted quota fail the same way again
+                    break
+                retry_after = _retry_after(e)
+            except Exception as e:
+                logger.error(f"YouTube API unexpected error: {e}")
+
+            # Exponential backoff, but never sooner than the server asked for
+            if attempt < self.max_retries - 1:
+                delay = self._backoff_delay(attempt)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                logger.info(f"Retrying in {delay:.2f} seconds...")
+                time.sleep(delay)
+
+        return {}
+
+    def _note_api_error(self, error: Exception) -> None:
+        """Stop the auto strategy from trying the API for a while once its quota runs out."""
+        if _is_quota_error(error):
+            logger.warning(
+                f"YouTube API quota exhausted; skipping the API for {API_QUOTA_COOLDOWN} seconds"
+            )
+            self._api_disabled_until = time.monotonic() + API_QUOTA_COOLDOWN
+
+    def _api_client_failed(self) -> bool:
+        """Whether building the API client was attempted and failed (without building it)."""
+        return self._youtube_service_ready and self._youtube_service is None
+
+    def _api_quota_exhausted(self) -> bool:
+        """Whether the API quota was recently reported exhausted."""
+        return time.monotonic() < self._api_disabled_until
+
+    def _api_http(self):
+        """
+        Return the HTTP connection for API requests made from the current thread.
+
+        httplib2 connections are not thread-safe, so only the thread that built the service
+        uses the service's own connection; every other thread gets a connection of its own.
+
+        Returns:
+            None to use the service's connection, otherwise this thread's connection
+        """
+        if threading.get_ident() == self._youtube_service_thread:
+            return None
+        return self._thread_http()
+
+    def _thread_http(self):
+        """Return an HTTP connection owned by the current thread."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            from googleapiclient.http import build_http
+
+            http = build_http()
+            http.timeout = self.timeout
+            self._local.http = http
+            with self._clients_lock:
+                self._clients.setdefault(threading.get_ident(), []).append(http)
+        return http
+
+    def _thread_ydl(self):
+        """Return a yt-dlp client owned by the current thread, created on first use."""
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            import yt_dlp
+
+            # Reusing one client keeps its HTTP connections open between videos
+            ydl = yt_dlp.YoutubeDL({"quiet": True, "no_warnings": True})
+            self._local.ydl = ydl
+            with self._clients_lock:
+                self._clients.setdefault(threading.get_ident(), []).append(ydl)
+        return ydl
+
+    @contextlib.contextmanager
+    def _worker_pool(self, max_workers: int):
+        """
+        Thread pool whose workers' yt-dlp clients and API connections are closed on exit.
+
+        Every pool starts fresh threads, so without this each batch would leave the clients
+        its workers created open for the lifetime of the extractor.
+
+        Args:
+            max_workers: Maximum number of worker threads
+
+        Yields:
+            ThreadPoolExecutor to submit work to
+        """
+        workers = set()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, initializer=lambda: workers.add(threading.get_ident())
+            ) as executor:
+                yield executor
+        finally:
+            with self._clients_lock:
+                released = [self._clients.pop(ident, []) for ident in workers]
+            for thread_clients in released:
+                for client in thread_clients:
+                    client.close()
+
+    def _parse_api_item(self, video_item: Dict) -> Dict:
+        """
+        Convert a videos.list response item into a video information dictionary.
+
+        Args:
+            video_item: Single item from a videos.list response
+
+        Returns:
+            Video information dictionary
+        """
+        snippet = video_item.get("snippet", {})
+        statistics = video_item.get("statistics", {})
+
+        return {
+            "title": snippet.get("title"),
+            "description": snippet.get("description"),
+            "channel_name": snippet.get("channelTitle"),
+            "publication_date": snippet.get("publishedAt"),
+            "views": (int(statistics.get("viewCount", 0)) if statistics.get("viewCount") else None),
+            "extraction_method": "youtube_api",
+        }
+
     def _get_video_info_yt_dlp(self, video_id: str) -> Optional[Dict]:
         """
         Extract video information using yt-dlp.
@@ -197,34 +614,37 @@ class YouTubeVideoInfoExtractor:
             logger.error("yt-dlp is not available")
             return None
 
-        video_url = f"https://www.youtube.com/watch?v={video_id}"
+        import yt_dlp
 
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-        }
+        video_url = f"https://www.youtube.com/watch?v={video_id}"
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
-                sanitized_info = ydl.sanitize_info(info)
-
-                # Convert upload_date to ISO format
-                publication_date = None
-                upload_date_str = sanitized_info.get("upload_date")
-                if upload_date_str:
-                    publication_date = datetime.strptime(upload_date_str, "%Y%m%d").isoformat()
+            ydl = self._thread_ydl()
+            # Only a few plain string/int fields are read, so the info dict is used as is;
+            # sanitize_info would deep-copy every format and thumbnail entry first
+            info = ydl.extract_info(video_url, download=False)
+
+            # Convert upload_date to ISO format
+            publication_date = None
+            upload_date_str = info.get("upload_date")
+            if upload_date_str and len(upload_date_str) == 8 and upload_date_str.isdigit():
+                # upload_date is YYYYMMDD; slicing avoids building a datetime per video
+                publication_date = (
+                    f"{upload_date_str[:4]}-{upload_date_str[4:6]}-{upload_date_str[6:8]}T00:00:00"
+                )
 
-                return {
-                    "title": sanitized_info.get("title"),
-                    "description": sanitized_info.get("description"),
-                    "channel_name": sanitized_info.get("channel") or sanitized_info.get("uploader"),
-                    "publication_date": publication_date,
-                    "views": sanitized_info.get("view_count"),
-                    "extraction_method": "yt_dlp",
-                }
+            return {
+                "title": info.get("title"),
+                "description": info.get("description"),
+                "channel_name": info.get("channel") or info.get("uploader"),
+                "publication_date": publication_date,
+                "views": info.get("view_count"),
+                "extraction_method": "yt_dlp",
+            }
 
         except yt_dlp.utils.DownloadError as e:
+            if _is_throttle_error(e):
+                raise YouTubeThrottleError(str(e)) from e
             logger.error(f"yt-dlp download error: {e}")
             return None
         except Exception as e:
@@ -245,6 +665,8 @@ class YouTubeVideoInfoExtractor:
             logger.error("pytubefix is not available")
             return None
 
+        from pytubefix import YouTube
+
         video_url = f"https://www.youtube.com/watch?v={video_id}"
 
         try:
@@ -260,6 +682,8 @@ class YouTubeVideoInfoExtractor:
             }
 
         except Exception as e:
+            if _is_throttle_error(e):
+                raise YouTubeThrottleError(str(e)) from e
             logger.error(f"pytubefix error: {e}")
             return None
 
@@ -288,24 +712,37 @@ class YouTubeVideoInfoExtractor:
             logger.error(f"Invalid video input: {video_input}")
             return None
 
+        return self._get_video_info_validated(video_id, strategy)
+
+    def _get_video_info_validated(self, video_id: str, strategy: Optional[str]) -> Optional[Dict]:
+        """
+        Extract video information for an ID that has already been validated.
+
+        Args:
+            video_id: Validated YouTube video ID
+            strategy: Override default strategy
+
+        Returns:
+            Video information dictionary or None on failure
+        """
         # Determine strategy
         use_strategy = strategy or self.strategy
 
+        if self.cache:
+            cached = self.cache.get(video_id, use_strategy)
+            if cached:
+                logger.info("Using cached info for video %s", video_id)
+                return cached
+
         # Rate limiting
-        time.sleep(self.rate_limit_delay)
+        if self._rate_limiter:
+            self._rate_limiter.acquire()
 
         result = None
 
         if use_strategy == "auto":
             # Try strategies in order of preference: API -> yt-dlp -> pytubefix
-            strategies = []
-
-            if self.youtube_service:
-                strategies.append("api")
-            if YT_DLP_AVAILABLE:
-                strategies.append("yt_dlp")
-            if PYTUBEFIX_AVAILABLE:
-                strategies.append("pytubefix")
+            strategies = self._available_strategies
 
             if not strategies:
                 logger.error(
@@ -314,7 +751,11 @@ class YouTubeVideoInfoExtractor:
                 return None
 
             for strat in strategies:
-                logger.info(f"Attempting extraction with strategy: {strat}")
+                # Building the client is the first step of an API lookup anyway; if it
+                # failed, every retry would fail the same way
+                if strat == "api" and (self._api_quota_exhausted() or self.youtube_service is None):
+                    continue
+                logger.info("Attempting extraction with strategy: %s", strat)
                 result = self._extract_with_retry(video_id, strat)
                 if result:
                     break
@@ -325,8 +766,12 @@ class YouTubeVideoInfoExtractor:
 
         if result:
             logger.info(
-                f"Successfully extracted info for video {video_id} using {result.get('extraction_method')}"
+                "Successfully extracted info for video %s using %s",
+                video_id,
+                result.get("extraction_method"),
             )
+            if self.cache:
+                self.cache.set(video_id, use_strategy, result)
             return result
         else:
             logger.error(f"Failed to extract video information for {video_id}")
@@ -343,27 +788,38 @@ class YouTubeVideoInfoExtractor:
         Returns:
             Video information or None
         """
+        if strategy not in self._STRATEGY_METHODS:
+            logger.error(f"Unknown strategy: {strategy}")
+            return None
+
+        # Resolve the method once per call instead of comparing strategy names per attempt
+        method_name, scrapes = self._STRATEGY_METHODS[strategy]
+        extract = getattr(self, method_name)
+
         for attempt in range(self.max_retries):
             try:
-                if strategy == "api":
-                    result = self._get_video_info_api(video_id)
-                elif strategy == "yt_dlp":
-                    result = self._get_video_info_yt_dlp(video_id)
-                elif strategy == "pytubefix":
-                    result = self._get_video_info_pytubefix(video_id)
+                if scrapes:
+                    with _SCRAPE_LIMITER:
+                        result = extract(video_id)
                 else:
-                    logger.error(f"Unknown strategy: {strategy}")
-                    return None
+                    result = extract(video_id)
 
                 if result:
                     return result
 
+            except PermanentExtractionError as e:
+                logger.error(f"{strategy} cannot extract {video_id}: {e}")
+                break
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1} failed with {strategy}: {e}")
 
+            # An exhausted quota fails every retry the same way
+            if strategy == "api" and self._api_quota_exhausted():
+                break
+
             # Exponential backoff
             if attempt < self.max_retries - 1:
-                delay = self.backoff_factor**attempt
+                delay = self._backoff_delay(attempt)
                 logger.info(f"Retrying in {delay:.2f} seconds...")
                 time.sleep(delay)
 
@@ -376,16 +832,9 @@ class YouTubeVideoInfoExtractor:
         Returns:
             List of available strategy names
         """
-        strategies = []
-
-        if self.youtube_service:
-            strategies.append("api")
-        if YT_DLP_AVAILABLE:
-            strategies.append("yt_dlp")
-        if PYTUBEFIX_AVAILABLE:
-            strategies.append("pytubefix")
-
-        return strategies
+        if self._api_client_failed():
+            return [strat for strat in self._available_strategies if strat != "api"]
+        return list(self._available_strategies)
 
     def test_api_key(self) -> bool:
         """
@@ -399,8 +848,10 @@ class YouTubeVideoInfoExtractor:
 
         try:
             # Test with a well-known video ID
-            request = self.youtube_service.videos().list(part="snippet", id="jNQXAC9IVRw")
-            response = request.execute()
+            request = self.youtube_service.videos().list(
+                part="snippet", id="jNQXAC9IVRw", fields="items/id"
+            )
+            response = request.execute(http=self._api_http())
             return len(response.get("items", [])) > 0
         except Exception as e:
             logger.error(f"API key test failed: {e}")
@@ -411,38 +862,335 @@ class YouTubeVideoInfoExtractor:
         video_inputs: List[str],
         strategy: Optional[str] = None,
         delay_between_requests: float = 0.5,
+        burst: int = 1,
+        concurrency: int = 1,
     ) -> List[Dict]:
         """
         Extract information for multiple videos.
 
+        Requests are paced by a token bucket: time spent on a request counts towards
+        the delay, so the loop only sleeps for whatever remains of it. With concurrency
+        above 1, yt-dlp/pytubefix lookups (including auto's fallbacks for videos the API
+        could not return) run on a thread pool so slow requests overlap;
+        they still start at the paced rate and results keep the input order. A lookup
+        backing off between retries only holds its own worker, so failing videos no
+        longer stall the rest of the batch. Repeated video IDs are extracted only once.
+
         Args:
             video_inputs: List of YouTube video IDs (11 characters each)
             strategy: Override default strategy
-            delay_between_requests: Delay between requests to avoid rate limiting
+            delay_between_requests: Average delay between requests to avoid rate limiting
+            burst: Number of requests allowed back-to-back before pacing starts
+            concurrency: Maximum number of per-video lookups in flight at once
 
         Returns:
             List of video information dictionaries
         """
-        results = []
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        use_strategy = strategy or self.strategy
+        if use_strategy == "api":
+            return self._batch_extract_api(video_inputs, delay_between_requests, burst)
+        if (
+            use_strategy == "auto"
+            and "api" in self._available_strategies
+            and not self._api_quota_exhausted()
+            and self.youtube_service is not None
+        ):
+            return self._batch_extract_auto(
+                video_inputs, delay_between_requests, burst, concurrency
+            )
+
+        limiter = (
+            TokenBucket(1 / delay_between_requests, burst) if delay_between_requests > 0 else None
+        )
+        # Duplicate inputs are extracted once and their result repeated at each position
+        unique_inputs = list(dict.fromkeys(video_inputs))
+        total = len(unique_inputs)
+
+        if concurrency == 1 or total < 2:
+            results = []
+            for i, video_input in enumerate(unique_inputs):
+                # Rate limiting between requests
+                if limiter:
+                    limiter.acquire()
+                results.append(self._extract_or_error(video_input, strategy, i, total))
+        else:
+            # Pace submissions in this thread so the pool never starts requests faster than
+            # the token bucket allows; the scrapers' adaptive limiter bounds them further.
+            with self._worker_pool(min(concurrency, total)) as executor:
+                futures = []
+                for i, video_input in enumerate(unique_inputs):
+                    if limiter:
+                        limiter.acquire()
+                    futures.append(
+                        executor.submit(self._extract_or_error, video_input, strategy, i, total)
+                    )
+                results = [future.result() for future in futures]
+
+        if total == len(video_inputs):
+            return results
+        by_input = dict(zip(unique_inputs, results))
+        return [by_input[video_input] for video_input in video_inputs]
+
+    def batch_extract_stream(
+        self,
+        video_inputs: List[str],
+        output_path: str,
+        strategy: Optional[str] = None,
+        delay_between_requests: float = 0.5,
+        burst: int = 1,
+        concurrency: int = 1,
+        chunk_size: int = API_BATCH_SIZE,
+        resume: bool = True,
+    ) -> int:
+        """
+        Extract information for multiple videos, writing results to a JSON Lines file.
+
+        Videos are extracted chunk_size at a time with batch_extract and each chunk is
+        written (one JSON object per line, in input order) before the next one starts, so
+        only one chunk of results is held in memory. Progress is recorded in a
+        "<output_path>.progress" sidecar after every chunk and removed once all videos are
+        written; with resume=True an interrupted run picks up after the last written chunk.
+        The sidecar records a fingerprint of the video list and strategy, so a run over a
+        different list (or with a different strategy) starts over instead of resuming.
+
+        Args:
+            video_inputs: List of YouTube video IDs (11 characters each)
+            output_path: Path to the JSON Lines output file
+            strategy: Override default strategy
+            delay_between_requests: Average delay between requests
+            burst: Number of requests allowed back-to-back before pacing starts
+            concurrency: Maximum number of yt-dlp/pytubefix lookups in flight
+            chunk_size: Number of videos extracted and written per chunk
+            resume: Whether to continue from an existing progress sidecar
+
+        Returns:
+            Number of results written by this call
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        progress_path = f"{output_path}.progress"
+        fingerprint = hashlib.sha256(
+            "\n".join([strategy or self.strategy, *video_inputs]).encode("utf-8")
+        ).hexdigest()
+        completed, offset = 0, 0
+        if resume and os.path.exists(progress_path) and os.path.exists(output_path):
+            with open(progress_path, "r", encoding="utf-8") as f:
+                progress = json.load(f)
+            if progress.get("fingerprint") == fingerprint:
+                completed, offset = progress["completed"], progress["offset"]
+                logger.info(f"Resuming batch after {completed}/{len(video_inputs)} videos")
+            else:
+                logger.warning(
+                    f"{progress_path} belongs to a different video list or strategy; starting over"
+                )
+
+        written = 0
+        with open(output_path, "r+b" if completed else "wb") as f:
+            # Drop any lines written after the last checkpoint by an interrupted run
+            f.truncate(offset)
+            f.seek(offset)
 
-        for i, video_input in enumerate(video_inputs):
-            logger.info(f"Processing video {i + 1}/{len(video_inputs)}: {video_input}")
+            for start in range(completed, len(video_inputs), chunk_size):
+                chunk = video_inputs[start : start + chunk_size]
+                results = self.batch_extract(
+                    chunk, strategy, delay_between_requests, burst, concurrency
+                )
+                f.writelines(_json_encode(result, False) + b"\n" for result in results)
+                f.flush()
+                written += len(results)
+
+                tmp_path = f"{progress_path}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as progress_file:
+                    json.dump(
+                        {
+                            "fingerprint": fingerprint,
+                            "completed": start + len(chunk),
+                            "offset": f.tell(),
+                        },
+                        progress_file,
+                    )
+                os.replace(tmp_path, progress_path)
+
+        if os.path.exists(progress_path):
+            os.remove(progress_path)
+
+        logger.info(f"Wrote {written} results to {output_path}")
+        return written
+
+    def _extract_or_error(
+        self, video_input: str, strategy: Optional[str], index: int, total: int
+    ) -> Dict:
+        """
+        Extract one video of a batch, returning an error entry if it fails.
+
+        Args:
+            video_input: YouTube video ID (11 characters)
+            strategy: Override default strategy
+            index: Position of the video in the batch
+            total: Number of videos in the batch
+
+        Returns:
+            Video information dictionary or error entry
+        """
+        # Per-video logs use lazy %-formatting so filtered-out messages cost no string building
+        logger.info("Processing video %d/%d: %s", index + 1, total, video_input)
+
+        # Validate once, for both the lookup and the error entry
+        video_id = self._validate_video_id(video_input)
+        result = self._get_video_info_validated(video_id, strategy) if video_id else None
+        if result:
+            return result
+
+        logger.warning(f"Failed to extract info for video: {video_input}")
+        return {
+            "video_id": video_id,
+            "error": "Extraction failed",
+            "extraction_method": None,
+        }
 
-            result = self.get_video_info(video_input, strategy)
-            if result:
-                results.append(result)
+    def _batch_extract_api(
+        self,
+        video_inputs: List[str],
+        delay_between_requests: float = 0.5,
+        burst: int = 1,
+        strategy: str = "api",
+    ) -> List[Dict]:
+        """
+        Extract information for multiple videos with batched YouTube Data API requests.
+
+        Args:
+            video_inputs: List of YouTube video IDs (11 characters each)
+            delay_between_requests: Average delay between batched requests
+            burst: Number of batched requests allowed back-to-back before pacing starts
+            strategy: Strategy name results are cached under
+
+        Returns:
+            List of video information dictionaries in input order
+        """
+        video_ids = [self._validate_video_id(video_input) for video_input in video_inputs]
+        valid_ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+
+        found = {}
+        if self.cache:
+            for video_id in valid_ids:
+                cached = self.cache.get(video_id, strategy)
+                if cached:
+                    found[video_id] = cached
+            valid_ids = [video_id for video_id in valid_ids if video_id not in found]
+
+        if valid_ids:
+            logger.info(f"Fetching {len(valid_ids)} videos in batches of up to {API_BATCH_SIZE}")
+            fetched = self._get_video_info_api_batch(valid_ids, delay_between_requests, burst)
+            if self.cache:
+                for video_id, info in fetched.items():
+                    self.cache.set(video_id, strategy, info)
+            found.update(fetched)
+
+        results = []
+        for video_input, video_id in zip(video_inputs, video_ids):
+            if video_id in found:
+                results.append(found[video_id])
             else:
                 logger.warning(f"Failed to extract info for video: {video_input}")
                 results.append(
                     {
-                        "video_id": self._validate_video_id(video_input),
+                        "video_id": video_id,
                         "error": "Extraction failed",
                         "extraction_method": None,
                     }
                 )
 
-            # Rate limiting between requests
-            if i < len(video_inputs) - 1:
-                time.sleep(delay_between_requests)
+        return results
+
+    def _batch_extract_auto(
+        self,
+        video_inputs: List[str],
+        delay_between_requests: float = 0.5,
+        burst: int = 1,
+        concurrency: int = 1,
+    ) -> List[Dict]:
+        """
+        Extract information for multiple videos with the auto strategy.
+
+        All videos are first requested through batched YouTube Data API calls; only the
+        videos the API could not return fall back to the scraping strategies, one video
+        per request.
+
+        Args:
+            video_inputs: List of YouTube video IDs (11 characters each)
+            delay_between_requests: Average delay between requests
+            burst: Number of requests allowed back-to-back before pacing starts
+            concurrency: Maximum number of fallback lookups in flight at once
+
+        Returns:
+            List of video information dictionaries in input order
+        """
+        results = self._batch_extract_api(
+            video_inputs, delay_between_requests, burst, strategy="auto"
+        )
+
+        fallbacks = [strat for strat in self._available_strategies if strat != "api"]
+        if not fallbacks:
+            return results
+
+        failed_ids = list(
+            dict.fromkeys(
+                result["video_id"]
+                for result in results
+                if result.get("error") and result.get("video_id")
+            )
+        )
+        if not failed_ids:
+            return results
+
+        limiter = (
+            TokenBucket(1 / delay_between_requests, burst) if delay_between_requests > 0 else None
+        )
+
+        if concurrency == 1 or len(failed_ids) < 2:
+            recovered = {}
+            for video_id in failed_ids:
+                if limiter:
+                    limiter.acquire()
+                recovered[video_id] = self._extract_with_fallbacks(video_id, fallbacks)
+        else:
+            with self._worker_pool(min(concurrency, len(failed_ids))) as executor:
+                futures = {}
+                for video_id in failed_ids:
+                    if limiter:
+                        limiter.acquire()
+                    futures[video_id] = executor.submit(
+                        self._extract_with_fallbacks, video_id, fallbacks
+                    )
+                recovered = {video_id: future.result() for video_id, future in futures.items()}
+
+        for i, result in enumerate(results):
+            info = recovered.get(result.get("video_id")) if result.get("error") else None
+            if info:
+                results[i] = info
 
         return results
+
+    def _extract_with_fallbacks(self, video_id: str, strategies: List[str]) -> Optional[Dict]:
+        """
+        Extract one video with each strategy in turn, caching the first success under "auto".
+
+        Args:
+            video_id: Validated YouTube video ID
+            strategies: Strategies to try, in order
+
+        Returns:
+            Video information or None if every strategy failed
+        """
+        for strat in strategies:
+            logger.info("Attempting extraction of %s with strategy: %s", video_id, strat)
+            info = self._extract_with_retry(video_id, strat)
+            if info:
+                if self.cache:
+                    self.cache.set(video_id, "auto", info)
+                return info
+        return None
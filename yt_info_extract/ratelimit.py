@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Rate limiting helpers for pacing requests to YouTube
+"""
+
+import threading
+import time
+from typing import Type
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Up to `burst` calls go through immediately; after that calls are paced to `rate`
+    per second. Unlike a fixed sleep after every request, time already spent waiting
+    on the network counts towards the next slot, so slow requests are not penalised
+    twice and fast requests still never exceed the configured rate.
+
+    Example:
+        limiter = TokenBucket(rate=2.0, burst=5)
+        for video_id in video_ids:
+            limiter.acquire()
+            fetch(video_id)
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Sustained number of calls allowed per second
+            burst: Number of calls allowed back-to-back before pacing starts
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        Returns:
+            Number of seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Reserve the token before sleeping so concurrent callers queue up in order
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Thread-safe concurrency limiter that adapts to server overload (AIMD).
+
+    Like TCP congestion control, the number of calls allowed in flight grows additively
+    (by roughly one per window of successful calls) and is cut multiplicatively whenever
+    a call fails with overload_exception, so concurrency settles near the level the
+    server tolerates without manual tuning.
+
+    Example:
+        limiter = AdaptiveConcurrencyLimiter(overload_exception=ThrottleError)
+        with limiter:
+            fetch(video_id)
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_concurrency: int = 2,
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        decrease_factor: float = 0.5,
+        overload_exception: Type[BaseException] = Exception,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_concurrency: Number of concurrent calls allowed at start
+            min_concurrency: Lower bound for the concurrency limit
+            max_concurrency: Upper bound for the concurrency limit
+            decrease_factor: Multiplier applied to the limit when a call is overloaded
+            overload_exception: Exception type that signals the server is overloaded
+        """
+        if not 1 <= min_concurrency <= initial_concurrency <= max_concurrency:
+            raise ValueError(
+                "Require 1 <= min_concurrency <= initial_concurrency <= max_concurrency"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.decrease_factor = decrease_factor
+        self.overload_exception = overload_exception
+        self._limit = float(initial_concurrency)
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    def acquire(self) -> None:
+        """Block until a slot is available, then take it."""
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, overloaded: bool = False) -> None:
+        """
+        Give back a slot and adjust the limit.
+
+        Args:
+            overloaded: Whether the call was rejected because the server is overloaded
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                self._limit = max(self.min_concurrency, self._limit * self.decrease_factor)
+            else:
+                self._limit = min(self.max_concurrency, self._limit + 1 / self._limit)
+            self._condition.notify_all()
+
+    def __enter__(self) -> "AdaptiveConcurrencyLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release(
+            overloaded=exc_type is not None and issubclass(exc_type, self.overload_exception)
+        )
@@ -4,14 +4,38 @@ Utility functions for YouTube video information extraction and processing
 """
 
 import csv
+import functools
+import importlib.util
 import json
 import logging
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from bisect import bisect_right
+from collections import Counter
+from datetime import date, time
+from itertools import chain, islice
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pyarrow takes a while to import, so only check that it is installed here
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
 
 logger = logging.getLogger(__name__)
 
+# Ascending view-count thresholds and the (divisor, suffix) used at or above each one
+_VIEW_THRESHOLDS = (1_000, 1_000_000, 1_000_000_000)
+_VIEW_UNITS = ((1_000, "K"), (1_000_000, "M"), (1_000_000_000, "B"))
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Write buffer for exported files; large exports reach the OS in 1 MiB writes
+_EXPORT_BUFFER_SIZE = 1 << 20
+
 
 def format_views(view_count: Optional[int]) -> str:
     """
@@ -26,15 +50,38 @@ def format_views(view_count: Optional[int]) -> str:
     if view_count is None:
         return "Unknown views"
 
-    if view_count >= 1_000_000_000:
-        return f"{view_count / 1_000_000_000:.1f}B views"
-    elif view_count >= 1_000_000:
-        return f"{view_count / 1_000_000:.1f}M views"
-    elif view_count >= 1_000:
-        return f"{view_count / 1_000:.1f}K views"
-    else:
+    index = bisect_right(_VIEW_THRESHOLDS, view_count)
+    if index == 0:
         return f"{view_count:,} views"
 
+    divisor, suffix = _VIEW_UNITS[index - 1]
+    return f"{view_count / divisor:.1f}{suffix} views"
+
+
+# English month names for publication dates, independent of the process locale
+_MONTH_NAMES = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+
+@functools.lru_cache(maxsize=8192)
+def _format_calendar_date(iso_date: str) -> str:
+    # Videos in a batch share publication days, so each day is parsed and formatted once;
+    # formatting from the parsed fields skips strftime's locale-aware formatting
+    day = date.fromisoformat(iso_date)
+    return f"{_MONTH_NAMES[day.month - 1]} {day.day:02d}, {day.year}"
+
 
 def format_publication_date(pub_date: Optional[str]) -> str:
     """
@@ -48,17 +95,22 @@ def format_publication_date(pub_date: Optional[str]) -> str:
     """
     if not pub_date:
         return "Unknown date"
+    if not isinstance(pub_date, str):
+        return pub_date
 
     try:
-        # Handle both with and without timezone
-        if pub_date.endswith("Z"):
-            dt = datetime.fromisoformat(pub_date.replace("Z", "+00:00"))
-        elif "+" in pub_date or pub_date.count("-") > 2:
-            dt = datetime.fromisoformat(pub_date)
-        else:
-            dt = datetime.fromisoformat(pub_date)
-
-        return dt.strftime("%B %d, %Y")
+        # Only the calendar date is displayed, and it is always the first 10 characters of
+        # an ISO 8601 string ("2005-04-23" or "2005-04-23T00:00:00Z"); any time part is
+        # only validated
+        if len(pub_date) > 10:
+            if pub_date[10] not in "T ":
+                raise ValueError("unexpected characters after date")
+            time_part = pub_date[11:]
+            if time_part.endswith("Z"):
+                time_part = time_part[:-1] + "+00:00"
+            time.fromisoformat(time_part)
+
+        return _format_calendar_date(pub_date[:10])
     except (ValueError, AttributeError) as e:
         logger.warning(f"Could not parse date {pub_date}: {e}")
         return pub_date
@@ -79,7 +131,7 @@ def clean_description(description: Optional[str], max_length: int = 500) -> str:
         return "No description available"
 
     # Remove excessive whitespace
-    cleaned = re.sub(r"\s+", " ", description.strip())
+    cleaned = _WHITESPACE_RE.sub(" ", description).strip()
 
     # Truncate if too long
     if len(cleaned) > max_length:
@@ -98,28 +150,64 @@ def extract_video_stats(video_info: Dict) -> Dict[str, Any]:
     Returns:
         Dictionary with formatted statistics
     """
+    views = video_info.get("views")
+    publication_date = video_info.get("publication_date")
+    description = video_info.get("description")
+
     return {
         "title": video_info.get("title", "Unknown"),
         "channel": video_info.get("channel_name", "Unknown"),
-        "formatted_views": format_views(video_info.get("views")),
-        "raw_views": video_info.get("views"),
-        "formatted_date": format_publication_date(video_info.get("publication_date")),
-        "raw_date": video_info.get("publication_date"),
-        "description_preview": clean_description(video_info.get("description"), 200),
+        "formatted_views": format_views(views),
+        "raw_views": views,
+        "formatted_date": format_publication_date(publication_date),
+        "raw_date": publication_date,
+        "description_preview": clean_description(description, 200),
         "extraction_method": video_info.get("extraction_method", "Unknown"),
-        "has_description": bool(video_info.get("description")),
-        "description_length": len(video_info.get("description", "")),
+        "has_description": bool(description),
+        "description_length": len(description) if description else 0,
     }
 
 
+def _json_encode(data: Any, pretty: bool) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:
+            # orjson rejects some values json accepts (e.g. integers wider than 64 bits)
+            pass
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json_array(items: Iterable[Dict], f: IO[bytes], pretty: bool) -> None:
+    """Write items as a JSON array one element at a time, matching _json_encode output."""
+    if pretty:
+        prefix, separator, suffix = b"\n  ", b",\n  ", b"\n]"
+    else:
+        prefix, separator, suffix = b"", b",", b"]"
+
+    f.write(b"[")
+    count = 0
+    for item in items:
+        f.write(separator if count else prefix)
+        if pretty:
+            f.write(_json_encode(item, pretty).replace(b"\n", b"\n  "))
+        else:
+            f.write(_json_encode(item, pretty))
+        count += 1
+    f.write(suffix if count else b"]")
+
+
 def export_to_json(
-    video_data: Union[Dict, List[Dict]], output_file: str, pretty: bool = True
+    video_data: Union[Dict, Iterable[Dict]], output_file: str, pretty: bool = True
 ) -> bool:
     """
     Export video information to JSON file.
 
     Args:
-        video_data: Single video info dict or list of video info dicts
+        video_data: Single video info dict or an iterable (list, generator) of video info dicts
         output_file: Path to output JSON file
         pretty: Whether to format JSON with indentation
 
@@ -127,11 +215,14 @@ def export_to_json(
         True if successful, False otherwise
     """
     try:
-        with open(output_file, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(video_data, f, ensure_ascii=False, indent=2)
+        # Written in binary mode: the encoders already produce UTF-8, so there is no
+        # text-layer decode and re-encode
+        with open(output_file, "wb", buffering=_EXPORT_BUFFER_SIZE) as f:
+            if isinstance(video_data, dict):
+                f.write(_json_encode(video_data, pretty))
             else:
-                json.dump(video_data, f, ensure_ascii=False)
+                # Stream list items so generators are written without materializing them
+                _write_json_array(video_data, f, pretty)
 
         logger.info(f"Successfully exported data to {output_file}")
         return True
@@ -141,12 +232,42 @@ def export_to_json(
         return False
 
 
-def export_to_csv(video_data: List[Dict], output_file: str) -> bool:
+# CSV columns written by export_to_csv
+_CSV_FIELDNAMES = [
+    "title",
+    "channel_name",
+    "views",
+    "publication_date",
+    "description",
+    "extraction_method",
+]
+
+
+def _csv_row(video: Dict) -> List[str]:
+    """Convert a video info dict into a flat, single-line CSV row in _CSV_FIELDNAMES order."""
+    row = []
+    for field in _CSV_FIELDNAMES:
+        value = video.get(field, "")
+        # Handle None values and clean strings
+        if value is None:
+            row.append("")
+        elif isinstance(value, str):
+            # Clean multiline descriptions for CSV
+            row.append(value.replace("\n", " ").replace("\r", " "))
+        else:
+            row.append(str(value))
+    return row
+
+
+def export_to_csv(video_data: Iterable[Dict], output_file: str) -> bool:
     """
     Export video information to CSV file.
 
+    Rows are written as they are pulled from video_data, so a generator is never held in
+    memory all at once.
+
     Args:
-        video_data: List of video information dictionaries
+        video_data: Iterable (list, generator) of video information dictionaries
         output_file: Path to output CSV file
 
     Returns:
@@ -157,35 +278,20 @@ def export_to_csv(video_data: List[Dict], output_file: str) -> bool:
         return False
 
     try:
-        # Define CSV columns
-        fieldnames = [
-            "title",
-            "channel_name",
-            "views",
-            "publication_date",
-            "description",
-            "extraction_method",
-        ]
-
-        with open(output_file, "w", newline="", encoding="utf-8") as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction="ignore")
-            writer.writeheader()
-
-            for video in video_data:
-                # Clean data for CSV
-                row = {}
-                for field in fieldnames:
-                    value = video.get(field, "")
-                    # Handle None values and clean strings
-                    if value is None:
-                        row[field] = ""
-                    elif isinstance(value, str):
-                        # Clean multiline descriptions for CSV
-                        row[field] = value.replace("\n", " ").replace("\r", " ")
-                    else:
-                        row[field] = str(value)
-
-                writer.writerow(row)
+        videos = iter(video_data)
+        first = next(videos, None)
+        if first is None:
+            logger.error("No data to export")
+            return False
+
+        with open(
+            output_file, "w", newline="", encoding="utf-8", buffering=_EXPORT_BUFFER_SIZE
+        ) as csvfile:
+            # Rows are built as lists in column order, so a plain writer suffices and skips
+            # DictWriter's per-row dict-to-list mapping
+            writer = csv.writer(csvfile)
+            writer.writerow(_CSV_FIELDNAMES)
+            writer.writerows(map(_csv_row, chain([first], videos)))
 
         logger.info(f"Successfully exported data to {output_file}")
         return True
@@ -195,6 +301,61 @@ def export_to_csv(video_data: List[Dict], output_file: str) -> bool:
         return False
 
 
+# Rows converted and written per Parquet row group by export_to_parquet
+_PARQUET_BATCH_ROWS = 10_000
+
+
+def export_to_parquet(video_data: Iterable[Dict], output_file: str) -> bool:
+    """
+    Export video information to a zstd-compressed Parquet file (requires pyarrow).
+
+    The file has the same columns as export_to_csv, with views stored as int64. Rows are
+    written in row groups as they are pulled from video_data, so a generator is never
+    held in memory all at once.
+
+    Args:
+        video_data: Iterable (list, generator) of video information dictionaries
+        output_file: Path to output Parquet file
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if not PYARROW_AVAILABLE:
+        logger.error("pyarrow is not installed. Install with: pip install yt-info-extract[parquet]")
+        return False
+
+    videos = iter(video_data)
+    batch = list(islice(videos, _PARQUET_BATCH_ROWS))
+    if not batch:
+        logger.error("No data to export")
+        return False
+
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [(field, pa.int64() if field == "views" else pa.string()) for field in _CSV_FIELDNAMES]
+        )
+        # Channel names and extraction methods repeat across rows, so dictionary-encode them
+        with pq.ParquetWriter(
+            output_file,
+            schema,
+            compression="zstd",
+            use_dictionary=["channel_name", "extraction_method"],
+        ) as writer:
+            while batch:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = list(islice(videos, _PARQUET_BATCH_ROWS))
+
+        logger.info(f"Successfully exported data to {output_file}")
+        return True
+
+    except Exception as e:
+        logger.error(f"Failed to export to Parquet: {e}")
+        return False
+
+
 def load_video_ids_from_file(file_path: str) -> List[str]:
     """
     Load video IDs from a text file (one per line).
@@ -207,8 +368,8 @@ def load_video_ids_from_file(file_path: str) -> List[str]:
     """
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            # Read lines and filter out empty ones
-            video_ids = [line.strip() for line in f.readlines() if line.strip()]
+            # Read the file in one call, strip each line once and drop empty ones
+            video_ids = [line for line in map(str.strip, f.read().splitlines()) if line]
 
         logger.info(f"Loaded {len(video_ids)} video IDs from {file_path}")
         return video_ids
@@ -233,34 +394,36 @@ def validate_video_info(video_info: Dict) -> Dict[str, Any]:
     """
     validation = {"is_valid": True, "errors": [], "warnings": [], "normalized_data": {}}
 
+    # Each field is looked up once and reused by the checks and the normalization
+    title = video_info.get("title", "")
+    channel_name = video_info.get("channel_name", "")
+    views = video_info.get("views")
+    publication_date = video_info.get("publication_date")
+    description = video_info.get("description")
+
     # Check required fields
-    required_fields = ["title", "channel_name"]
-    for field in required_fields:
-        if not video_info.get(field):
+    for field, value in (("title", title), ("channel_name", channel_name)):
+        if not value:
             validation["errors"].append(f"Missing or empty required field: {field}")
             validation["is_valid"] = False
 
     # Check optional but important fields
-    if not video_info.get("views"):
+    if not views:
         validation["warnings"].append("View count is missing")
 
-    if not video_info.get("publication_date"):
+    if not publication_date:
         validation["warnings"].append("Publication date is missing")
 
-    if not video_info.get("description"):
+    if not description:
         validation["warnings"].append("Description is missing")
 
     # Normalize data
     validation["normalized_data"] = {
-        "title": str(video_info.get("title", "")).strip(),
-        "channel_name": str(video_info.get("channel_name", "")).strip(),
-        "views": video_info.get("views") if isinstance(video_info.get("views"), int) else None,
-        "publication_date": video_info.get("publication_date"),
-        "description": (
-            str(video_info.get("description", "")).strip()
-            if video_info.get("description")
-            else None
-        ),
+        "title": str(title).strip(),
+        "channel_name": str(channel_name).strip(),
+        "views": views if isinstance(views, int) else None,
+        "publication_date": publication_date,
+        "description": str(description).strip() if description else None,
         "extraction_method": video_info.get("extraction_method", "unknown"),
     }
 
@@ -281,40 +444,52 @@ def create_summary_report(video_data_list: List[Dict]) -> Dict[str, Any]:
         return {"error": "No video data provided"}
 
     total_videos = len(video_data_list)
-    successful_extractions = len([v for v in video_data_list if not v.get("error")])
+    successful_extractions = 0
 
-    # Statistics
+    # Statistics, gathered in a single pass with running totals instead of per-video lists
     total_views = 0
-    view_counts = []
-    extraction_methods = {}
-    channels = {}
-    dates = []
+    view_count = 0
+    max_views = 0
+    min_views = 0
+    extraction_methods = Counter()
+    channels = Counter()
+    date_count = 0
+    earliest = None
+    latest = None
 
     for video in video_data_list:
         if video.get("error"):
             continue
-
-        # Views
-        if video.get("views"):
-            total_views += video["views"]
-            view_counts.append(video["views"])
-
-        # Extraction methods
-        method = video.get("extraction_method", "unknown")
-        extraction_methods[method] = extraction_methods.get(method, 0) + 1
-
-        # Channels
-        channel = video.get("channel_name", "Unknown")
-        channels[channel] = channels.get(channel, 0) + 1
-
-        # Dates
-        if video.get("publication_date"):
-            dates.append(video["publication_date"])
+        successful_extractions += 1
+
+        views = video.get("views")
+        if views:
+            total_views += views
+            if view_count:
+                if views > max_views:
+                    max_views = views
+                elif views < min_views:
+                    min_views = views
+            else:
+                max_views = min_views = views
+            view_count += 1
+
+        extraction_methods[video.get("extraction_method", "unknown")] += 1
+        channels[video.get("channel_name", "Unknown")] += 1
+
+        publication_date = video.get("publication_date")
+        if publication_date:
+            if date_count:
+                if publication_date < earliest:
+                    earliest = publication_date
+                elif publication_date > latest:
+                    latest = publication_date
+            else:
+                earliest = latest = publication_date
+            date_count += 1
 
     # Calculate statistics
-    avg_views = total_views / len(view_counts) if view_counts else 0
-    max_views = max(view_counts) if view_counts else 0
-    min_views = min(view_counts) if view_counts else 0
+    avg_views = total_views / view_count if view_count else 0
 
     return {
         "total_videos_processed": total_videos,
@@ -331,11 +506,12 @@ def create_summary_report(video_data_list: List[Dict]) -> Dict[str, Any]:
             "formatted_total": format_views(total_views),
             "formatted_average": format_views(int(avg_views)),
         },
-        "extraction_methods": extraction_methods,
-        "top_channels": dict(sorted(channels.items(), key=lambda x: x[1], reverse=True)[:10]),
+        "extraction_methods": dict(extraction_methods),
+        # most_common keeps first-seen order among ties, like a stable descending sort
+        "top_channels": dict(channels.most_common(10)),
         "date_range": {
-            "earliest": min(dates) if dates else None,
-            "latest": max(dates) if dates else None,
-            "total_videos_with_dates": len(dates),
+            "earliest": earliest,
+            "latest": latest,
+            "total_videos_with_dates": date_count,
         },
     }